@@ -0,0 +1,85 @@
+# common.py
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from feature_space import (
+    Feature, Column, Change, MiddleBollingerBand, STD, BottomBollingerBand,
+    TopBollingerBand, Volatility, TRAMA, Momentum, MomentumOscillator, RSI,
+    EMA, SMA, MACD, Flips, MACDSignal, MACDHistogram, LiquiditySpikes, ATR,
+    SuperTrend
+)
+
+__all__ = [
+    "frame",
+    "columns",
+    "INDICATORS",
+    "ROWS",
+    "BACKENDS",
+    "TIMEOUT"
+]
+
+ROWS = [10_000, 100_000, 1_000_000, 10_000_000]
+
+BACKENDS = ['pandas', 'numpy', 'numba']
+
+TIMEOUT = 600
+
+def frame(rows: int, seed: int = 0) -> pd.DataFrame:
+
+    generator = np.random.default_rng(seed)
+
+    close = 100 * np.exp(np.cumsum(generator.normal(0, 0.001, rows)))
+    spread = np.abs(generator.normal(0, 0.002, rows)) * close
+
+    return pd.DataFrame(
+        {
+            'Open': close * (1 + generator.normal(0, 0.0005, rows)),
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': generator.lognormal(10, 1, rows)
+        },
+        index=pd.date_range('2020-01-01', periods=rows, freq='min')
+    )
+
+def columns() -> dict[str, Column]:
+
+    return {
+        name.lower(): Column(name)
+        for name in ('Open', 'High', 'Low', 'Close', 'Volume')
+    }
+
+INDICATORS: dict[str, Callable[..., Feature]] = {
+    'Change': lambda close, **_: Change(close),
+    'MiddleBollingerBand': lambda close, **_: MiddleBollingerBand(close, 20),
+    'STD': lambda close, **_: STD(close, 20),
+    'BottomBollingerBand': lambda close, **_: BottomBollingerBand(
+        MiddleBollingerBand(close, 20), STD(close, 20)
+    ),
+    'TopBollingerBand': lambda close, **_: TopBollingerBand(
+        MiddleBollingerBand(close, 20), STD(close, 20)
+    ),
+    'Volatility': lambda close, **_: Volatility(Change(close)),
+    'TRAMA': lambda close, **_: TRAMA(Volatility(Change(close)), 20),
+    'Momentum': lambda close, **_: Momentum(Change(close), 35),
+    'MomentumOscillator': lambda close, **_: MomentumOscillator(close, 10),
+    'RSI': lambda close, **_: RSI(Change(close), 14),
+    'EMA': lambda close, **_: EMA(close, 34),
+    'SMA': lambda close, **_: SMA(close, 20),
+    'MACD': lambda close, **_: MACD(EMA(close, 34), SMA(close, 20)),
+    'Flips': lambda close, **_: Flips(EMA(close, 34), SMA(close, 20)),
+    'MACDSignal': lambda close, **_: MACDSignal(
+        MACD(EMA(close, 34), SMA(close, 20)), 15
+    ),
+    'MACDHistogram': lambda close, **_: MACDHistogram(
+        MACDSignal(MACD(EMA(close, 34), SMA(close, 20)), 15)
+    ),
+    'LiquiditySpikes': lambda volume, **_: LiquiditySpikes(volume, 20, 2),
+    'ATR': lambda high, low, close, **_: ATR(high, low, close, 14),
+    'SuperTrend': lambda high, low, close, **_: SuperTrend(
+        close, ATR(high, low, close, 14), 14, 3
+    )
+}
@@ -0,0 +1,169 @@
+# graphs.py
+
+from feature_space import (
+    Feature, Column, Dataset, Change, SMA, EMA, STD, Momentum, RSI, MACD,
+    MACDSignal, MACDHistogram, MiddleBollingerBand, TopBollingerBand,
+    BottomBollingerBand, ATR, SuperTrend, LiquiditySpikes
+)
+
+from benchmarks.common import frame, columns, BACKENDS, TIMEOUT
+
+__all__ = [
+    "fan_out",
+    "deep_chain",
+    "nested",
+    "FanOut",
+    "DeepChain",
+    "Nested",
+    "Compile"
+]
+
+def fan_out(width: int) -> list[Feature]:
+
+    close = Column('Close')
+    change = Change(close)
+
+    features = []
+
+    for span in range(2, width + 2):
+        features.extend(
+            [
+                SMA(close, span), EMA(close, span), STD(close, span),
+                Momentum(change, span), RSI(change, span)
+            ]
+        )
+
+    return features
+
+def deep_chain(depth: int) -> list[Feature]:
+
+    feature = Column('Close')
+
+    features = []
+
+    for level in range(depth):
+        feature = MACDHistogram(
+            MACDSignal(
+                MACD(
+                    EMA(feature, 12 + level, name=f'EMA_{level}'),
+                    SMA(feature, 26 + level, name=f'SMA_{level}'),
+                    name=f'MACD_{level}'
+                ),
+                9, name=f'MACD_Signal_{level}'
+            ),
+            name=f'MACD_Histogram_{level}'
+        )
+
+        features.append(feature)
+
+    return features
+
+def nested(breadth: int) -> Dataset:
+
+    inputs = columns()
+
+    close, volume = inputs['close'], inputs['volume']
+
+    datasets = []
+
+    for span in range(10, 10 * (breadth + 1), 10):
+        band = MiddleBollingerBand(close, span)
+        std = STD(close, span)
+        atr = ATR(inputs['high'], inputs['low'], close, span)
+
+        datasets.append(
+            Dataset(
+                name=f'Bands_{span}',
+                features=[TopBollingerBand(band, std), BottomBollingerBand(band, std)],
+                datasets=[
+                    Dataset(
+                        name=f'Trend_{span}',
+                        features=[
+                            SuperTrend(close, atr, span, 3),
+                            LiquiditySpikes(volume, span, 2)
+                        ]
+                    )
+                ]
+            )
+        )
+
+    return Dataset(name='Nested', datasets=datasets)
+
+class FanOut:
+
+    params = [[10, 100], [10_000, 100_000, 1_000_000], BACKENDS]
+    param_names = ['width', 'rows', 'backend']
+    timeout = TIMEOUT
+
+    def setup(self, width: int, rows: int, backend: str) -> None:
+
+        self.data = frame(rows)
+        self.dataset = Dataset(features=fan_out(width), backend=backend)
+        self.dataset.compile()
+
+    def time_transform(self, width: int, rows: int, backend: str) -> None:
+
+        self.dataset.transform(self.data, cached=False)
+
+    def peakmem_transform(self, width: int, rows: int, backend: str) -> None:
+
+        self.dataset.transform(self.data, cached=False)
+
+class DeepChain:
+
+    params = [[1, 10, 50], [10_000, 100_000, 1_000_000], BACKENDS]
+    param_names = ['depth', 'rows', 'backend']
+    timeout = TIMEOUT
+
+    def setup(self, depth: int, rows: int, backend: str) -> None:
+
+        self.data = frame(rows)
+        self.dataset = Dataset(features=deep_chain(depth), backend=backend)
+        self.dataset.compile()
+
+    def time_transform(self, depth: int, rows: int, backend: str) -> None:
+
+        self.dataset.transform(self.data, cached=False)
+
+    def time_transform_released(self, depth: int, rows: int, backend: str) -> None:
+
+        self.dataset.transform(self.data, cached=False, release=True)
+
+    def peakmem_transform_released(self, depth: int, rows: int, backend: str) -> None:
+
+        self.dataset.transform(self.data, cached=False, release=True)
+
+class Nested:
+
+    params = [[2, 10], [10_000, 100_000, 1_000_000], BACKENDS]
+    param_names = ['breadth', 'rows', 'backend']
+    timeout = TIMEOUT
+
+    def setup(self, breadth: int, rows: int, backend: str) -> None:
+
+        self.data = frame(rows)
+        self.dataset = nested(breadth)
+        self.dataset.backend = backend
+        self.dataset.compile()
+
+    def time_transform(self, breadth: int, rows: int, backend: str) -> None:
+
+        self.dataset.transform(self.data, cached=False)
+
+    def time_calculate_chunked(self, breadth: int, rows: int, backend: str) -> None:
+
+        for _ in self.dataset.calculate_chunked(self.data, chunk_size=100_000):
+            pass
+
+class Compile:
+
+    params = [[100, 1000]]
+    param_names = ['width']
+
+    def setup(self, width: int) -> None:
+
+        self.features = fan_out(width)
+
+    def time_compile(self, width: int) -> None:
+
+        Dataset(features=self.features).compile()
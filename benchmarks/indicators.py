@@ -0,0 +1,83 @@
+# indicators.py
+
+from feature_space import Dataset, backing
+
+from benchmarks.common import frame, columns, INDICATORS, ROWS, BACKENDS, TIMEOUT
+
+__all__ = [
+    "Indicators",
+    "Streaming",
+    "Live"
+]
+
+class Indicators:
+
+    params = [list(INDICATORS), ROWS, BACKENDS]
+    param_names = ['indicator', 'rows', 'backend']
+    timeout = TIMEOUT
+
+    def setup(self, indicator: str, rows: int, backend: str) -> None:
+
+        self.data = frame(rows)
+        self.feature = INDICATORS[indicator](**columns())
+
+        Dataset(features=self.feature.features, backend=backend).transform(self.data)
+
+    def calculate(self, backend: str) -> None:
+
+        with backing(backend):
+            self.feature.evaluate(self.data, cached=False, materialize=False)
+
+    def time_calculate(self, indicator: str, rows: int, backend: str) -> None:
+
+        self.calculate(backend)
+
+    def peakmem_calculate(self, indicator: str, rows: int, backend: str) -> None:
+
+        self.calculate(backend)
+
+class Streaming:
+
+    params = [list(INDICATORS), [1, 100]]
+    param_names = ['indicator', 'batch']
+    timeout = TIMEOUT
+
+    def setup(self, indicator: str, batch: int) -> None:
+
+        data = frame(10_000 + batch)
+
+        self.history = data.iloc[:10_000].copy()
+        self.batch = data.iloc[10_000:]
+
+        self.dataset = Dataset(features=[INDICATORS[indicator](**columns())])
+        self.dataset.calculate(self.history)
+        self.dataset.plan.update(self.batch.copy())
+
+    def time_update(self, indicator: str, batch: int) -> None:
+
+        self.dataset.update(self.batch.copy())
+
+class Live:
+
+    params = [list(INDICATORS)]
+    param_names = ['indicator']
+    timeout = TIMEOUT
+
+    def setup(self, indicator: str) -> None:
+
+        data = frame(10_001)
+
+        self.bar = data.iloc[-1]
+
+        self.engine = Dataset(
+            features=[INDICATORS[indicator](**columns())]
+        ).live().start(data.iloc[:10_000].copy())
+
+    def time_push(self, indicator: str) -> None:
+
+        self.engine.push(self.bar)
+
+    def peakmem_push(self, indicator: str) -> None:
+
+        for _ in range(100):
+            self.engine.push(self.bar)
@@ -1,5 +1,20 @@
 # __init__.py
 
+from feature_space.groups import *
+from feature_space.store import *
+from feature_space.cache import *
+from feature_space.storage import *
+from feature_space.stream import *
+from feature_space.fused import *
+from feature_space.compiled import *
+from feature_space.lifetime import *
+from feature_space.profiler import *
+from feature_space.spec import *
+from feature_space.snapshot import *
+from feature_space.dtypes import *
 from feature_space.feature import *
 from feature_space.features import *
+from feature_space.parallel import *
+from feature_space.plan import *
+from feature_space.live import *
 from feature_space.dataset import *
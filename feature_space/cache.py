@@ -0,0 +1,182 @@
+# cache.py
+
+import os
+import hashlib
+from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Generator, Any
+
+import numpy as np
+import pandas as pd
+
+from feature_space.groups import GROUPS
+
+__all__ = [
+    "ResultCache",
+    "caching",
+    "fingerprint",
+    "CACHE"
+]
+
+def fingerprint(data: pd.Series | pd.Index) -> str:
+
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(data, pd.Series):
+        digest.update(fingerprint(data.index).encode())
+
+    if isinstance(data, pd.RangeIndex):
+        digest.update(repr((data.start, data.stop, data.step)).encode())
+
+        return digest.hexdigest()
+
+    values = np.asarray(data)
+
+    if values.dtype.hasobject:
+        values = pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+    digest.update(str(values.dtype).encode())
+    digest.update(np.ascontiguousarray(values).view(np.uint8))
+
+    return digest.hexdigest()
+
+@dataclass
+class ResultCache:
+
+    path: str | Path
+    size: int | None = None
+    entries: OrderedDict[str, int] = field(
+        default_factory=OrderedDict, repr=False
+    )
+
+    def __post_init__(self) -> None:
+
+        self.path = Path(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        files = sorted(self.path.glob('*.npy'), key=lambda p: p.stat().st_mtime)
+
+        for file in files:
+            self.entries[file.stem] = file.stat().st_size
+
+    @property
+    def total(self) -> int:
+
+        return sum(self.entries.values())
+
+    def location(self, key: str) -> Path:
+
+        return self.path / f'{key}.npy'
+
+    def key(self, feature: Any) -> str:
+
+        groups = GROUPS.get()
+
+        spec = [
+            type(feature).__module__,
+            type(feature).__qualname__,
+            feature.name,
+            repr(sorted(feature.kwargs.items())),
+            (
+                hashlib.blake2b(groups.codes.tobytes(), digest_size=16).hexdigest()
+                if groups is not None else ''
+            ),
+            *(
+                f.key if f.key is not None else fingerprint(f.result)
+                for f in feature.features
+            )
+        ]
+
+        return hashlib.blake2b(
+            '\0'.join(spec).encode(), digest_size=16
+        ).hexdigest()
+
+    def load(self, key: str, index: pd.Index) -> pd.Series | None:
+
+        location = self.location(key)
+
+        try:
+            values = np.load(location, mmap_mode='r', allow_pickle=False)
+            os.utime(location)
+
+        except (FileNotFoundError, ValueError):
+            self.entries.pop(key, None)
+
+            return None
+
+        if len(values) != len(index):
+            return None
+
+        self.entries[key] = location.stat().st_size
+        self.entries.move_to_end(key)
+
+        return pd.Series(values, index=index)
+
+    def save(self, key: str, result: pd.Series) -> None:
+
+        values = np.asarray(result)
+
+        if values.dtype.hasobject:
+            return
+
+        location = self.location(key)
+        temporary = location.with_suffix('.tmp')
+
+        with open(temporary, 'wb') as file:
+            np.save(file, values, allow_pickle=False)
+
+        os.replace(temporary, location)
+
+        self.entries[key] = location.stat().st_size
+        self.entries.move_to_end(key)
+
+        self.evict()
+
+    def evict(self) -> None:
+
+        if self.size is None:
+            return
+
+        total = self.total
+
+        while (total > self.size) and (len(self.entries) > 1):
+            key, size = self.entries.popitem(last=False)
+            total -= size
+
+            try:
+                os.remove(self.location(key))
+
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+
+        for key in list(self.entries):
+            try:
+                os.remove(self.location(key))
+
+            except FileNotFoundError:
+                pass
+
+        self.entries.clear()
+
+CACHE: ContextVar[ResultCache | None] = ContextVar('CACHE', default=None)
+
+@contextmanager
+def caching(cache: ResultCache | None) -> Generator[ResultCache | None, None, None]:
+
+    if cache is None:
+        yield CACHE.get()
+
+        return
+
+    token = CACHE.set(cache)
+
+    try:
+        yield cache
+
+    finally:
+        CACHE.reset(token)
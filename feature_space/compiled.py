@@ -0,0 +1,373 @@
+# compiled.py
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Generator
+
+import numpy as np
+import pandas as pd
+
+from feature_space.groups import GROUPS, arrange
+from feature_space.fused import window_arrays, MEAN, DEVIATION
+
+try:
+    import numba
+
+except ImportError:
+    numba = None
+
+__all__ = [
+    "backing",
+    "backend",
+    "conform",
+    "smoothed_true_range",
+    "super_trend_signal",
+    "liquidity_spike_scores",
+    "BACKEND",
+    "BACKENDS",
+    "PANDAS",
+    "NUMPY",
+    "NUMBA"
+]
+
+PANDAS, NUMPY, NUMBA = 'pandas', 'numpy', 'numba'
+
+BACKENDS = (PANDAS, NUMPY, NUMBA)
+
+BACKEND: ContextVar[str] = ContextVar('BACKEND', default=PANDAS)
+
+@contextmanager
+def backing(value: str | None) -> Generator[str, None, None]:
+
+    if value is None:
+        yield BACKEND.get()
+
+        return
+
+    if value not in BACKENDS:
+        raise ValueError(f'backend must be one of {BACKENDS}, not {value!r}.')
+
+    token = BACKEND.set(value)
+
+    try:
+        yield value
+
+    finally:
+        BACKEND.reset(token)
+
+def backend() -> str:
+
+    value = BACKEND.get()
+
+    if (value == NUMBA) and (numba is None):
+        return NUMPY
+
+    return value
+
+def conform(result: pd.Series | np.ndarray) -> pd.Series | np.ndarray:
+
+    if (result is None) or (BACKEND.get() == PANDAS):
+        return result
+
+    return np.ascontiguousarray(result)
+
+def jit(function: Callable) -> Callable | None:
+
+    if numba is None:
+        return None
+
+    return numba.njit(cache=True, error_model='numpy')(function)
+
+def arranged(
+        function: Callable[..., np.ndarray],
+        *arrays: pd.Series | np.ndarray,
+        **kwargs
+) -> np.ndarray:
+
+    arrays = [np.asarray(array, dtype=float) for array in arrays]
+
+    order, starts = arrange(GROUPS.get(), len(arrays[0]))
+
+    if order is not None:
+        arrays = [array[order] for array in arrays]
+
+    result = np.asarray(function(*arrays, starts=starts, **kwargs))
+
+    if order is None:
+        return result
+
+    arranged_result = np.empty_like(result)
+    arranged_result[order] = result
+
+    return arranged_result
+
+def anchored(values: np.ndarray, starts: np.ndarray, position: int) -> np.ndarray:
+
+    anchors = starts + position
+    valid = anchors < len(values)
+    valid[valid] = starts[anchors[valid]] == starts[valid]
+
+    result = np.full(len(values), np.nan)
+    result[valid] = values[anchors[valid]]
+
+    return result
+
+def _smoothed_true_range_loop(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        starts: np.ndarray,
+        span: int,
+        alpha: float
+) -> np.ndarray:
+
+    length = len(close)
+    result = np.empty(length)
+
+    weighted = np.nan
+    weight = 1.0
+    count = 0
+
+    for i in range(length):
+        value = high[i] - low[i]
+
+        if starts[i] == i:
+            weighted = np.nan
+            weight = 1.0
+            count = 0
+
+        else:
+            for bound in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                if (bound > value) or (value != value):
+                    value = bound
+
+        observed = value == value
+
+        if observed:
+            count += 1
+
+        if weighted == weighted:
+            weight *= 1 - alpha
+
+            if observed:
+                if weighted != value:
+                    weighted = (
+                        (weight * weighted) + (alpha * value)
+                    ) / (weight + alpha)
+
+                weight = 1.0
+
+        elif observed:
+            weighted = value
+
+        result[i] = weighted if count >= span else np.nan
+
+    return result
+
+def _smoothed_true_range_vectorized(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        starts: np.ndarray,
+        span: int,
+        alpha: float
+) -> np.ndarray:
+
+    previous = np.empty(len(close))
+    previous[1:] = close[:-1]
+    previous[:1] = np.nan
+
+    segments = None
+
+    if starts.any():
+        first = starts == np.arange(len(close))
+        previous[first] = np.nan
+        segments = np.cumsum(first)
+
+    ranges = high - low
+    np.fmax(ranges, np.abs(high - previous), out=ranges)
+    np.fmax(ranges, np.abs(low - previous), out=ranges)
+
+    ranges = pd.Series(ranges, copy=False)
+
+    if segments is None:
+        smoothed = ranges.ewm(alpha=alpha, adjust=False, min_periods=span).mean()
+
+    else:
+        smoothed = ranges.groupby(segments, sort=False).ewm(
+            alpha=alpha, adjust=False, min_periods=span
+        ).mean()
+
+    return smoothed.to_numpy()
+
+def _super_trend_vectorized(
+        data: np.ndarray,
+        atr: np.ndarray,
+        starts: np.ndarray,
+        span: int,
+        factor: float
+) -> np.ndarray:
+
+    window = (MEAN, span, span)
+
+    means = window_arrays(data, [window], starts=starts)[window]
+
+    means = np.where(np.isnan(means), anchored(means, starts, span - 1), means)
+
+    return np.select(
+        [data > means + factor * atr, data < means - factor * atr],
+        [1, -1], default=0
+    )
+
+def _liquidity_spikes_loop(
+        data: np.ndarray,
+        starts: np.ndarray,
+        span: int,
+        gradual: bool
+) -> np.ndarray:
+
+    length = len(data)
+
+    scores = np.empty(length)
+
+    mean = 0.0
+    squares = 0.0
+    count = 0
+
+    for i in range(length):
+        if starts[i] == i:
+            mean = 0.0
+            squares = 0.0
+            count = 0
+
+        value = data[i]
+
+        if value == value:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            squares += delta * (value - mean)
+
+        if i - span >= starts[i]:
+            removed = data[i - span]
+
+            if removed == removed:
+                count -= 1
+
+                if count > 0:
+                    delta = removed - mean
+                    mean -= delta / count
+                    squares -= delta * (removed - mean)
+
+                else:
+                    mean = 0.0
+                    squares = 0.0
+
+        average = mean if count > 0 else 0.0
+        deviation = np.sqrt(max(squares / (count - 1), 0.0)) if count > 1 else 0.0
+
+        scores[i] = (value - average) / deviation
+
+    if gradual:
+        for i in range(length):
+            if scores[i] != scores[i]:
+                anchor = starts[i] + 1
+
+                if (anchor < length) and (starts[anchor] == starts[i]):
+                    scores[i] = scores[anchor]
+
+    return scores
+
+def _liquidity_spikes_vectorized(
+        data: np.ndarray,
+        starts: np.ndarray,
+        span: int,
+        gradual: bool
+) -> np.ndarray:
+
+    windows = [(MEAN, span, 1), (DEVIATION, span, 1)]
+
+    results = window_arrays(data, windows, starts=starts)
+
+    average, deviation = (
+        np.nan_to_num(results[window], nan=0.0) for window in windows
+    )
+
+    single = np.isnan(results[windows[1]]) & ~np.isnan(data)
+    average[single] = data[single]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = (data - average) / deviation
+
+    if gradual:
+        return np.where(np.isnan(scores), anchored(scores, starts, 1), scores)
+
+    return scores
+
+_KERNELS = {
+    name: (None if loop is None else jit(loop), vectorized)
+    for name, loop, vectorized in (
+        (
+            'smoothed_true_range',
+            _smoothed_true_range_loop,
+            _smoothed_true_range_vectorized
+        ),
+        (
+            'super_trend',
+            None,
+            _super_trend_vectorized
+        ),
+        (
+            'liquidity_spikes',
+            _liquidity_spikes_loop,
+            _liquidity_spikes_vectorized
+        )
+    )
+}
+
+def kernel(name: str) -> Callable[..., np.ndarray]:
+
+    compiled, vectorized = _KERNELS[name]
+
+    if (backend() == NUMBA) and (compiled is not None):
+        return compiled
+
+    return vectorized
+
+def smoothed_true_range(
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        span: int,
+        alpha: float
+) -> np.ndarray:
+
+    return arranged(
+        kernel('smoothed_true_range'), high, low, close,
+        span=span, alpha=float(alpha)
+    )
+
+def super_trend_signal(
+        data: pd.Series,
+        atr: pd.Series,
+        span: int,
+        factor: float
+) -> np.ndarray:
+
+    return arranged(
+        kernel('super_trend'), data, atr, span=span, factor=float(factor)
+    )
+
+def liquidity_spike_scores(
+        data: pd.Series,
+        span: int,
+        threshold: float,
+        gradual: bool
+) -> np.ndarray:
+
+    scores = arranged(kernel('liquidity_spikes'), data, span=span, gradual=gradual)
+
+    if gradual:
+        return scores
+
+    return np.where(scores > threshold, 1, 0)
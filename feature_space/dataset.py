@@ -1,17 +1,424 @@
 # dataset.py
 
 import dill
+import asyncio
 from uuid import uuid4
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from contextvars import copy_context
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import Executor
+from typing import ContextManager, Generator, Iterable, Any
 
 import pandas as pd
 
-from feature_space.feature import Feature
+from feature_space.feature import Feature, sort_features, merge_features, detached
+from feature_space.plan import Plan, INSERT, BATCH
+from feature_space.live import LiveEngine
+from feature_space.groups import Groups, grouping
+from feature_space.fused import fusing
+from feature_space.store import ResultStore, storing
+from feature_space.cache import ResultCache, caching
+from feature_space.storage import ColumnStorage
+from feature_space.compiled import backing
+from feature_space.dtypes import DTypePolicy, casting
+from feature_space.lifetime import ResultMemory
+from feature_space.profiler import Profiler, profiling
+from feature_space.spec import (
+    registered, features_spec, build_features, dump_spec, read_spec
+)
+from feature_space.snapshot import (
+    save_snapshot, load_snapshot, restore_results, is_snapshot
+)
 
 __all__ = [
-    "Dataset"
+    "Dataset",
+    "Selection",
+    "UpdateQueue",
+    "FeatureIndex",
+    "Members",
+    "attach",
+    "insert",
+    "group_by",
+    "executing",
+    "chunks"
 ]
 
+def attach(data: pd.DataFrame, results: dict[str, pd.Series]) -> pd.DataFrame:
+
+    if not results:
+        return data.copy()
+
+    return pd.concat(
+        [
+            data.drop(columns=[name for name in results if name in data.columns]),
+            pd.DataFrame(results, index=data.index)
+        ],
+        axis=1
+    )
+
+def group_by(data: pd.DataFrame, groups: Any = None) -> Groups | None:
+
+    if (groups is None) or isinstance(groups, Groups):
+        return groups
+
+    return Groups.from_data(data, groups)
+
+def insert(
+        data: pd.DataFrame | ColumnStorage,
+        results: dict[str, pd.Series]
+) -> None:
+
+    if isinstance(data, pd.DataFrame):
+        data[list(results)] = attach(data.iloc[:, :0], results)
+
+        return
+
+    for name, result in results.items():
+        data[name] = result
+
+def chunks(
+        source: pd.DataFrame | ColumnStorage | Iterable[pd.DataFrame],
+        size: int,
+        columns: list[str] = None
+) -> Generator[pd.DataFrame, None, None]:
+
+    if isinstance(source, ColumnStorage):
+        columns = [name for name in columns or source.columns if name in source]
+
+        for start in range(0, len(source), size):
+            yield source.rows(start, start + size, columns=columns)
+
+    elif isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), size):
+            yield source.iloc[start:start + size].copy()
+
+    else:
+        yield from source
+
+def prune(
+        data: pd.DataFrame | ColumnStorage,
+        columns: Iterable[str]
+) -> pd.DataFrame:
+
+    columns = [name for name in dict.fromkeys(columns) if name in data.columns]
+
+    if isinstance(data, ColumnStorage):
+        return data.to_frame(columns)
+
+    return data[columns]
+
+@contextmanager
+def executing(
+        plan: Plan,
+        backend: str | None = None,
+        dtypes: DTypePolicy | None = None,
+        groups: Groups | None = None,
+        store: ResultStore = None,
+        cache: ResultCache = None,
+        profiler: Profiler = None
+) -> Generator[Plan, None, None]:
+
+    with (
+        grouping(groups), storing(store), caching(cache),
+        fusing(plan.fusion), backing(backend), casting(dtypes),
+        profiling(profiler)
+    ):
+        yield plan
+
+@dataclass
+class Selection:
+
+    plan: Plan
+    names: list[str] = field(default_factory=list)
+    backend: str | None = None
+    dtypes: DTypePolicy | None = None
+
+    @property
+    def result_memory(self) -> ResultMemory | None:
+
+        return self.plan.result_memory
+
+    def collect(
+            self,
+            data: pd.DataFrame | ColumnStorage,
+            cached: bool = True,
+            override: bool = False,
+            executor: Executor = None,
+            groups: Any = None,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            spill: ColumnStorage = None,
+            profiler: Profiler = None
+    ) -> pd.DataFrame:
+
+        groups = group_by(data, groups)
+
+        data = prune(data, self.plan.features_names)
+
+        with executing(
+            self.plan, backend=self.backend, dtypes=self.dtypes,
+            groups=groups, store=store, cache=cache, profiler=profiler
+        ):
+            results = self.plan.execute(
+                data=data, cached=cached, override=override,
+                materialize=BATCH, executor=executor,
+                release=True, spill=spill
+            )
+
+        for feature in [*self.plan.targets, *(alias for _, alias in self.plan.aliases)]:
+            if feature.name not in results:
+                results[feature.name] = (
+                    data[feature.name] if feature.name in data.columns
+                    else feature.materialized
+                )
+
+        return attach(data.iloc[:, :0], {name: results[name] for name in self.names})
+
+@dataclass
+class UpdateQueue:
+
+    dataset: Any = field(repr=False)
+    maxsize: int = 64
+    materialize: str = INSERT
+    executor: Executor | None = field(default=None, repr=False)
+    profiler: Profiler | None = field(default=None, repr=False)
+    queue: asyncio.Queue | None = field(default=None, init=False, repr=False)
+    worker: asyncio.Task | None = field(default=None, init=False, repr=False)
+    error: BaseException | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+
+        if self.maxsize < 1:
+            raise ValueError(f'maxsize must be positive, not {self.maxsize}.')
+
+        if self.materialize not in (INSERT, BATCH):
+            raise ValueError(
+                f'materialize must be one of {(INSERT, BATCH)}, '
+                f'not {self.materialize!r}.'
+            )
+
+    async def __aenter__(self) -> "UpdateQueue":
+
+        self.start()
+
+        return self
+
+    async def __aexit__(self, kind: Any, value: Any, traceback: Any) -> None:
+
+        try:
+            if kind is None:
+                await self.join()
+
+        finally:
+            await self.aclose()
+
+    @property
+    def pending(self) -> int:
+
+        return 0 if self.queue is None else self.queue.qsize()
+
+    @property
+    def running(self) -> bool:
+
+        return (self.worker is not None) and not self.worker.done()
+
+    def check(self) -> None:
+
+        if self.error is not None:
+            raise RuntimeError(
+                f'An update of {self.dataset.name} failed, '
+                f'and the queued updates after it were dropped.'
+            ) from self.error
+
+    def start(self) -> asyncio.Queue:
+
+        self.check()
+
+        loop = asyncio.get_running_loop()
+
+        if (not self.running) or (self.worker.get_loop() is not loop):
+            self.queue = asyncio.Queue(self.maxsize)
+            self.worker = loop.create_task(self.run())
+
+        return self.queue
+
+    async def put(self, data: pd.DataFrame) -> None:
+
+        await self.start().put(data)
+
+    async def join(self) -> None:
+
+        if self.queue is not None:
+            await self.queue.join()
+
+        self.check()
+
+    def close(self) -> None:
+
+        if self.worker is not None:
+            self.worker.cancel()
+
+        self.queue = None
+        self.worker = None
+
+    async def aclose(self) -> None:
+
+        worker = self.worker
+
+        self.close()
+
+        if (worker is not None) and (worker.get_loop() is asyncio.get_running_loop()):
+            try:
+                await worker
+
+            except asyncio.CancelledError:
+                pass
+
+    def process(self, frames: list[pd.DataFrame]) -> None:
+
+        if len(frames) == 1:
+            self.dataset.update(
+                frames[0], materialize=self.materialize,
+                profiler=self.profiler, atomic=True
+            )
+
+            return
+
+        data = pd.concat(frames)
+
+        self.dataset.update(
+            data, materialize=BATCH, profiler=self.profiler, atomic=True
+        )
+
+        start = 0
+
+        for frame in frames:
+            stop = start + len(frame)
+
+            results = {
+                name: data[name].to_numpy()[start:stop]
+                for name in data.columns if name not in frame.columns
+            }
+
+            if results:
+                insert(frame, results)
+
+            start = stop
+
+    async def run(self) -> None:
+
+        loop = asyncio.get_running_loop()
+        queue = self.queue
+
+        while True:
+            batch = [await queue.get()]
+
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                if self.error is None:
+                    await loop.run_in_executor(
+                        self.executor, copy_context().run, self.process, batch
+                    )
+
+            except Exception as error:
+                self.error = error
+
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+class Members(list):
+
+    def __init__(self, items: Iterable = (), owner: Any = None) -> None:
+
+        super().__init__(items)
+
+        self.owner = owner
+
+    def changed(self) -> None:
+
+        owner = getattr(self, 'owner', None)
+
+        if owner is not None:
+            owner.invalidate()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+
+        super().__setitem__(key, value)
+        self.changed()
+
+    def __delitem__(self, key: Any) -> None:
+
+        super().__delitem__(key)
+        self.changed()
+
+    def __iadd__(self, other: Iterable) -> "Members":
+
+        super().__iadd__(other)
+        self.changed()
+
+        return self
+
+    def __imul__(self, other: int) -> "Members":
+
+        super().__imul__(other)
+        self.changed()
+
+        return self
+
+    def append(self, item: Any) -> None:
+
+        super().append(item)
+        self.changed()
+
+    def extend(self, items: Iterable) -> None:
+
+        super().extend(items)
+        self.changed()
+
+    def insert(self, index: int, item: Any) -> None:
+
+        super().insert(index, item)
+        self.changed()
+
+    def remove(self, item: Any) -> None:
+
+        super().remove(item)
+        self.changed()
+
+    def pop(self, index: int = -1) -> Any:
+
+        item = super().pop(index)
+        self.changed()
+
+        return item
+
+    def clear(self) -> None:
+
+        super().clear()
+        self.changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+
+        super().sort(*args, **kwargs)
+        self.changed()
+
+    def reverse(self) -> None:
+
+        super().reverse()
+        self.changed()
+
+@dataclass
+class FeatureIndex:
+
+    key: tuple
+    features: list[Feature] = field(default_factory=list)
+    datasets_features: list[Feature] = field(default_factory=list)
+    ids: dict[str, Feature] = field(default_factory=dict)
+    names: dict[str, Feature] = field(default_factory=dict)
+
 @dataclass
 class Dataset:
 
@@ -19,11 +426,116 @@ class Dataset:
     id: str = field(default_factory=lambda: str(uuid4()), repr=False)
     features: list[Feature] = field(default_factory=list)
     datasets: list['Dataset'] = field(default_factory=list)
+    plan: Plan | None = field(default=None, repr=False)
+    backend: str | None = None
+    dtypes: DTypePolicy | None = None
+    fuse: bool = False
 
     def __hash__(self) -> int:
 
         return hash(self.name)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+
+        if name in ('features', 'datasets'):
+            if not (isinstance(value, Members) and (value.owner is self)):
+                value = Members(value, owner=self)
+
+            super().__setattr__(name, value)
+
+            self.invalidate()
+
+            return
+
+        if (name == 'fuse') and (value != self.__dict__.get('fuse')):
+            self.plan = None
+
+        if name == 'plan':
+            self.__dict__['_compiled'] = None if value is None else self.version
+
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+
+        state = self.__dict__.copy()
+        state.pop('_updates', None)
+
+        return state
+
+    def invalidate(self) -> None:
+
+        self.__dict__['_version'] = self.__dict__.get('_version', 0) + 1
+        self.__dict__['_index'] = None
+
+        self.plan = None
+
+    @property
+    def version(self) -> tuple[int, ...]:
+
+        versions = []
+
+        stack = [self]
+
+        while stack:
+            dataset = stack.pop()
+
+            versions.append(dataset.__dict__.get('_version', 0))
+
+            stack.extend(getattr(dataset, 'datasets', ()))
+
+        return tuple(versions)
+
+    @property
+    def features_index(self) -> FeatureIndex:
+
+        key = self.version
+        index = self.__dict__.get('_index')
+
+        if (index is not None) and (index.key == key):
+            return index
+
+        datasets_features = {}
+
+        for dataset in self.datasets:
+            for feature in dataset.features_index.features:
+                datasets_features.setdefault(feature.id, feature)
+
+        features = list(self.features)
+        ids = {feature.id: feature for feature in features}
+
+        for identifier, feature in datasets_features.items():
+            if identifier not in ids:
+                ids[identifier] = feature
+                features.append(feature)
+
+        names = {}
+
+        for feature in features:
+            names.setdefault(feature.name, feature)
+
+        index = FeatureIndex(
+            key=key,
+            features=features,
+            datasets_features=list(datasets_features.values()),
+            ids=ids,
+            names=names
+        )
+
+        self.__dict__['_index'] = index
+
+        return index
+
+    def feature(self, key: str) -> Feature:
+
+        index = self.features_index
+
+        feature = index.ids.get(key, index.names.get(key))
+
+        if feature is None:
+            raise KeyError(f'{key} is not a feature of {self.name}.')
+
+        return feature
+
     @property
     def all_features_names(self) -> list[str]:
 
@@ -47,25 +559,32 @@ class Dataset:
     @property
     def datasets_features(self) -> list[Feature]:
 
-        features = []
+        return self.features_index.datasets_features.copy()
 
-        for dataset in self.datasets:
-            for feature in dataset.all_features:
-                if feature not in features:
-                    features.append(feature)
+    @property
+    def all_features(self) -> list[Feature]:
 
-        return features
+        return self.features_index.features.copy()
 
     @property
-    def all_features(self) -> list[Feature]:
+    def targets(self) -> list[Feature]:
 
-        features = self.features.copy()
+        targets = []
 
-        for feature in self.datasets_features:
-            if feature not in features:
-                features.append(feature)
+        stack = [(self, False)]
+
+        while stack:
+            dataset, expanded = stack.pop()
 
-        return features
+            if expanded:
+                targets.extend(dataset.features)
+
+                continue
+
+            stack.append((dataset, True))
+            stack.extend((d, False) for d in reversed(dataset.datasets))
+
+        return targets
 
     @property
     def results(self) -> list[pd.Series]:
@@ -75,6 +594,11 @@ class Dataset:
 
         return [f.result for f in set(self.features)]
 
+    @property
+    def result_memory(self) -> ResultMemory | None:
+
+        return None if self.plan is None else self.plan.result_memory
+
     @property
     def features_calculated(self) -> bool:
 
@@ -99,20 +623,160 @@ class Dataset:
 
         return copy
 
-    def save(self, path: str) -> None:
+    def structure(self) -> dict[str, Any]:
+
+        return dict(
+            id=self.id,
+            name=self.name,
+            features=[f.id for f in self.features],
+            datasets=[d.structure() for d in self.datasets],
+            backend=self.backend,
+            dtypes=None if self.dtypes is None else asdict(self.dtypes),
+            fuse=self.fuse
+        )
+
+    @classmethod
+    def from_structure(
+            cls,
+            structure: dict[str, Any],
+            features: dict[str, Feature]
+    ) -> "Dataset":
+
+        return cls(
+            id=structure['id'],
+            name=structure['name'],
+            features=[features[key] for key in structure['features']],
+            datasets=[
+                cls.from_structure(dataset, features)
+                for dataset in structure['datasets']
+            ],
+            backend=structure.get('backend'),
+            dtypes=(
+                None if structure.get('dtypes') is None
+                else DTypePolicy(**structure['dtypes'])
+            ),
+            fuse=structure.get('fuse', False)
+        )
+
+    def to_spec(self) -> dict[str, Any]:
+
+        return dict(
+            features=features_spec(sort_features(self.targets)),
+            dataset=self.structure()
+        )
+
+    @classmethod
+    def from_spec(cls, spec: dict[str, Any]) -> "Dataset":
+
+        return cls.from_structure(
+            spec['dataset'], build_features(spec['features'])
+        )
+
+    def save(
+            self,
+            path: str,
+            results: bool = False,
+            index: pd.Index = None
+    ) -> None:
+
+        if results:
+            save_snapshot(
+                self.to_spec(), sort_features(self.targets), path, index=index
+            )
 
-        copy = self.copy()
-        copy.clear()
+            return
 
-        with open(path, 'wb') as file:
-            dill.dump(copy, file)
+        if all(registered(feature) for feature in sort_features(self.targets)):
+            dump_spec(self.to_spec(), path)
+
+            return
+
+        with detached(sort_features(self.targets)), open(path, 'wb') as file:
+            dill.dump(self, file)
 
     @classmethod
-    def load(cls, path: str) -> "Feature":
+    def load(
+            cls,
+            path: str,
+            results: bool | Iterable[str] = True
+    ) -> "Dataset":
+
+        if is_snapshot(path):
+            spec, storage = load_snapshot(path)
+
+            dataset = cls.from_spec(spec)
+
+            restore_results(sort_features(dataset.targets), storage, results)
+
+            return dataset
+
+        spec = read_spec(path)
+
+        if spec is not None:
+            return cls.from_spec(spec)
 
         with open(path, 'rb') as file:
             return dill.load(file)
 
+    def compile(self) -> Plan:
+
+        targets = self.targets
+
+        merged = merge_features(sort_features(targets), targets)
+
+        stack = [self]
+
+        while stack:
+            dataset = stack.pop()
+            features = [
+                merged[f.id] if merged[f.id].name == f.name else f
+                for f in dataset.features
+            ]
+
+            if any(a is not b for a, b in zip(features, dataset.features)):
+                dataset.features = features
+
+            stack.extend(dataset.datasets)
+
+        self.plan = Plan.compile(self.targets, merged, fuse=self.fuse)
+
+        return self.plan
+
+    def planned(self) -> Plan:
+
+        if (self.plan is None) or (self.__dict__.get('_compiled') != self.version):
+            return self.compile()
+
+        return self.plan
+
+    def select(self, names: str | Iterable[str]) -> Selection:
+
+        names = [names] if isinstance(names, str) else list(dict.fromkeys(names))
+
+        plan = self.planned()
+
+        features = {}
+
+        for feature in plan.features:
+            features.setdefault(feature.name, feature)
+
+        for _, alias in plan.aliases:
+            features.setdefault(alias.name, alias)
+
+        unknown = [name for name in names if name not in features]
+
+        if unknown:
+            raise ValueError(f'Features {unknown} are not in {self.name}.')
+
+        return Selection(
+            plan=Plan.compile(
+                [features[name] for name in names],
+                {alias.id: feature for feature, alias in plan.aliases},
+                fuse=self.fuse
+            ),
+            names=names, backend=self.backend, dtypes=self.dtypes
+        )
+
     def calculate_features(
             self,
             data: pd.DataFrame,
@@ -137,15 +801,226 @@ class Dataset:
 
         return self
 
+    def context(
+            self,
+            data: pd.DataFrame,
+            groups: Any = None,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            profiler: Profiler = None
+    ) -> ContextManager[Plan]:
+
+        return executing(
+            self.planned(), backend=self.backend, dtypes=self.dtypes,
+            groups=group_by(data, groups), store=store, cache=cache,
+            profiler=profiler
+        )
+
     def calculate(
             self,
             data: pd.DataFrame,
             cached: bool = True,
-            override: bool = False
+            override: bool = False,
+            materialize: str = INSERT,
+            executor: Executor = None,
+            groups: Any = None,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            release: bool = False,
+            spill: ColumnStorage = None,
+            profiler: Profiler = None
     ) -> 'Dataset':
 
-        self.calculate_datasets(data=data, cached=cached, override=override)
-        self.calculate_features(data=data, cached=cached, override=override)
+        with self.context(data, groups, store, cache, profiler) as plan:
+            results = plan.execute(
+                data=data, cached=cached, override=override,
+                materialize=materialize, executor=executor,
+                release=release, spill=spill
+            )
+
+        if (materialize == BATCH) and results:
+            insert(data, results)
+
+        return self
+
+    def transform(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            executor: Executor = None,
+            groups: Any = None,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            release: bool = False,
+            spill: ColumnStorage = None,
+            profiler: Profiler = None
+    ) -> pd.DataFrame:
+
+        with self.context(data, groups, store, cache, profiler) as plan:
+            results = plan.execute(
+                data=data, cached=cached, override=override,
+                materialize=BATCH, executor=executor,
+                release=release, spill=spill
+            )
+
+        return attach(data, results)
+
+    async def acalculate(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            materialize: str = INSERT,
+            executor: Executor = None,
+            groups: Any = None,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            release: bool = False,
+            spill: ColumnStorage = None,
+            profiler: Profiler = None
+    ) -> 'Dataset':
+
+        with self.context(data, groups, store, cache, profiler) as plan:
+            results = await plan.aexecute(
+                data=data, cached=cached, override=override,
+                materialize=materialize, executor=executor,
+                release=release, spill=spill
+            )
+
+        if (materialize == BATCH) and results:
+            insert(data, results)
+
+        return self
+
+    async def atransform(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            executor: Executor = None,
+            groups: Any = None,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            release: bool = False,
+            spill: ColumnStorage = None,
+            profiler: Profiler = None
+    ) -> pd.DataFrame:
+
+        with self.context(data, groups, store, cache, profiler) as plan:
+            results = await plan.aexecute(
+                data=data, cached=cached, override=override,
+                materialize=BATCH, executor=executor,
+                release=release, spill=spill
+            )
+
+        return attach(data, results)
+
+    def calculate_chunked(
+            self,
+            source: pd.DataFrame | ColumnStorage | Iterable[pd.DataFrame],
+            chunk_size: int = 100_000,
+            cached: bool = True,
+            override: bool = False,
+            executor: Executor = None,
+            cache: ResultCache = None,
+            release: bool = False,
+            profiler: Profiler = None
+    ) -> Generator[pd.DataFrame, None, None]:
+
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be positive, not {chunk_size}.')
+
+        plan = self.planned()
+
+        overlap = plan.lookback
+
+        if overlap is None:
+            raise ValueError(
+                f'Cannot calculate {self.name} in chunks, '
+                f'as not all of its features have a bounded lookback.'
+            )
+
+        previous = None
+
+        for chunk in chunks(source, chunk_size, columns=plan.features_names):
+            if len(chunk) == 0:
+                continue
+
+            if (previous is not None) and (len(previous) > 0):
+                data = pd.concat([previous, chunk])
+
+            else:
+                data = chunk
+
+            output = self.transform(
+                data, cached=cached, override=override, executor=executor,
+                store=ResultStore(), cache=cache, release=release,
+                profiler=profiler
+            )
+
+            yield output.iloc[len(data) - len(chunk):]
+
+            previous = data.iloc[len(data) - min(overlap, len(data)):]
+
+    def update(
+            self,
+            data: pd.DataFrame,
+            materialize: str = INSERT,
+            profiler: Profiler = None,
+            atomic: bool = False
+    ) -> 'Dataset':
+
+        plan = self.planned()
+
+        with backing(self.backend), casting(self.dtypes), profiling(profiler):
+            results = plan.update(data=data, materialize=materialize, atomic=atomic)
+
+        if materialize == BATCH:
+            results = {
+                name: result for name, result in results.items()
+                if name not in data.columns
+            }
+
+            if results:
+                insert(data, results)
+
+        return self
+
+    def live(self, capacity: int = None) -> LiveEngine:
+
+        return LiveEngine(self, capacity=capacity)
+
+    def updater(
+            self,
+            maxsize: int = 64,
+            materialize: str = INSERT,
+            executor: Executor = None,
+            profiler: Profiler = None
+    ) -> UpdateQueue:
+
+        updates = self.__dict__.get('_updates')
+
+        if updates is not None:
+            updates.close()
+
+        updates = UpdateQueue(
+            self, maxsize=maxsize, materialize=materialize,
+            executor=executor, profiler=profiler
+        )
+
+        self.__dict__['_updates'] = updates
+
+        return updates
+
+    async def aupdate(self, data: pd.DataFrame) -> 'Dataset':
+
+        updates = self.__dict__.get('_updates')
+
+        if updates is None:
+            updates = self.updater()
+
+        await updates.put(data)
 
         return self
 
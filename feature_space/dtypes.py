@@ -0,0 +1,77 @@
+# dtypes.py
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Generator
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "DTypePolicy",
+    "casting",
+    "downcast",
+    "DTYPES"
+]
+
+@dataclass(frozen=True)
+class DTypePolicy:
+
+    continuous: str | None = 'float32'
+    signal: str | None = 'int8'
+
+    def dtype(self, values: np.ndarray, signal: bool = False) -> np.dtype | None:
+
+        if signal and (self.signal is not None) and (values.dtype.kind in 'biu'):
+            return np.dtype(self.signal)
+
+        if (self.continuous is not None) and (values.dtype.kind == 'f'):
+            return np.dtype(self.continuous)
+
+        return None
+
+    def cast(
+            self,
+            result: pd.Series | np.ndarray,
+            signal: bool = False
+    ) -> pd.Series | np.ndarray:
+
+        dtype = self.dtype(np.asarray(result), signal=signal)
+
+        if (dtype is None) or (dtype == result.dtype):
+            return result
+
+        return result.astype(dtype)
+
+DTYPES: ContextVar[DTypePolicy | None] = ContextVar('DTYPES', default=None)
+
+@contextmanager
+def casting(
+        policy: DTypePolicy | None
+) -> Generator[DTypePolicy | None, None, None]:
+
+    if policy is None:
+        yield DTYPES.get()
+
+        return
+
+    token = DTYPES.set(policy)
+
+    try:
+        yield policy
+
+    finally:
+        DTYPES.reset(token)
+
+def downcast(
+        result: pd.Series | np.ndarray | None,
+        signal: bool = False
+) -> pd.Series | np.ndarray | None:
+
+    policy = DTYPES.get()
+
+    if (policy is None) or not isinstance(result, (pd.Series, np.ndarray)):
+        return result
+
+    return policy.cast(result, signal=signal)
@@ -2,14 +2,37 @@
 
 import dill
 from uuid import uuid4
-from typing import Callable, ParamSpec, ParamSpecKwargs
+from copy import deepcopy
+from contextlib import contextmanager
+from typing import Callable, Iterable, ParamSpec, ParamSpecKwargs, Generator, Any
 from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
 
+from feature_space.stream import Kernel
+from feature_space.store import ResultStore, State, storing
+from feature_space.cache import ResultCache, CACHE, caching, fingerprint
+from feature_space.storage import ColumnStorage
+from feature_space.compiled import conform
+from feature_space.dtypes import downcast
+from feature_space.profiler import Profiler, PROFILER, HIT, MISS, profiling
+from feature_space.spec import (
+    register, registered, parameters, arguments, features_spec,
+    build_features, dump_spec, read_spec
+)
+from feature_space.snapshot import (
+    save_snapshot, load_snapshot, restore_results, is_snapshot
+)
+
 __all__ = (
     'Feature',
-    'Column'
+    'Column',
+    'sort_features',
+    'required_features',
+    'level_features',
+    'merge_features',
+    'detached'
 )
 
 _P = ParamSpec('_P')
@@ -23,8 +46,14 @@ class Feature:
     features: list['Feature'] = field(default_factory=list)
     kwargs: P = field(default_factory=dict)
     calculator: Callable[['Feature'], pd.Series] = field(default=None, repr=False)
-    data: pd.DataFrame | None = field(default=None, repr=False)
-    result: pd.Series | None = field(default=None, repr=False)
+    kernel: Kernel | None = field(default=None, repr=False)
+    lookback: int | None = field(default=None, repr=False)
+    signal: bool = field(default=False, repr=False)
+
+    data = State()
+    result = State()
+    key = State()
+    restored = State()
 
     def __hash__(self) -> int:
 
@@ -35,6 +64,14 @@ class Feature:
 
         return self.result is not None
 
+    @property
+    def materialized(self) -> pd.Series | None:
+
+        if not self.features:
+            return self.result
+
+        return downcast(self.result, signal=self.signal)
+
     @property
     def all_features_names(self) -> list[str]:
 
@@ -48,20 +85,18 @@ class Feature:
     @property
     def all_features(self) -> set['Feature']:
 
-        features = set()
-
-        for feature in self.features:
-            features.update(feature.all_features)
-
-        features.add(self)
-
-        return features
+        return set(sort_features([self]))
 
     @property
     def features_names(self) -> list[str]:
 
         return [f.name for f in self.features]
 
+    @property
+    def dependencies(self) -> list['Feature']:
+
+        return sort_features([self])
+
     def copy(self) -> "Feature":
 
         copy = type(self).__new__(type(self))
@@ -69,46 +104,256 @@ class Feature:
         for key, value in self.__reduce__()[-1].items():
             setattr(copy, key, value)
 
+        copy.kernel = deepcopy(self.kernel)
+
         return copy
 
-    def save(self, path: str) -> None:
+    def to_spec(self) -> dict[str, Any]:
+
+        return dict(features=features_spec(self.dependencies), target=self.id)
+
+    @classmethod
+    def from_spec(cls, spec: dict[str, Any]) -> "Feature":
+
+        return build_features(spec['features'])[spec['target']]
+
+    def save(
+            self,
+            path: str,
+            results: bool = False,
+            index: pd.Index = None
+    ) -> None:
+
+        if results:
+            save_snapshot(self.to_spec(), self.dependencies, path, index=index)
+
+            return
 
-        copy = self.copy()
-        copy.clear()
+        if all(registered(feature) for feature in self.dependencies):
+            dump_spec(self.to_spec(), path)
 
-        with open(path, 'wb') as file:
+            return
+
+        with detached(self.dependencies), open(path, 'wb') as file:
             dill.dump(self, file)
 
     @classmethod
-    def load(cls, path: str) -> "Feature":
+    def load(
+            cls,
+            path: str,
+            results: bool | Iterable[str] = True
+    ) -> "Feature":
+
+        if is_snapshot(path):
+            spec, storage = load_snapshot(path)
+
+            feature = cls.from_spec(spec)
+
+            restore_results(feature.dependencies, storage, results)
+
+            return feature
+
+        spec = read_spec(path)
+
+        if spec is not None:
+            return cls.from_spec(spec)
 
         with open(path, 'rb') as file:
             return dill.load(file)
 
-    def calculate(
+    def resolved(
             self,
             data: pd.DataFrame,
             cached: bool = True,
             override: bool = False
+    ) -> bool:
+
+        return (
+            (cached and (self.result is not None)) or
+            ((self.name in data.columns) and not override)
+        )
+
+    def restorable(self, data: pd.DataFrame) -> bool:
+
+        result = self.result
+
+        return (
+            (result is not None) and (result is self.restored) and
+            (self.name not in data.columns) and
+            isinstance(result, pd.Series) and result.index.equals(data.index)
+        )
+
+    def evaluate(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            materialize: bool = True
     ) -> 'Feature':
 
         if cached and (self.result is not None):
             return self
 
         if (self.name in data.columns) and not override:
-            self.result = data[self.name]
+            self.result = conform(data[self.name])
+            self.key = (
+                fingerprint(self.result) if CACHE.get() is not None else None
+            )
 
             return self
 
-        for feature in self.features:
-            feature.calculate(data, cached=cached)
+        self.prepare(data)
+
+        profiler = PROFILER.get()
+        start = profiler.start() if profiler is not None else None
+
+        hit = self.lookup()
+
+        if not hit:
+            self.result = conform(self.calculator(self))
+            self.commit()
+
+        if profiler is not None:
+            profiler.record(
+                self, start,
+                cache=HIT if hit else (MISS if self.key is not None else None)
+            )
+
+        if materialize:
+            self.write(data)
+
+        return self
+
+    def write(self, data: pd.DataFrame) -> None:
+
+        materialized = self.materialized
+
+        data[self.name] = materialized
+
+        if isinstance(data, ColumnStorage) and (materialized is self.result):
+            self.result = conform(data[self.name])
+
+    def prepare(self, data: pd.DataFrame) -> None:
 
         if self.calculator is None:
             raise ValueError(f'Feature calculator of {self} is not defined.')
 
+        if self.kernel is not None:
+            self.kernel.reset()
+
+        self.data = data
+
+    def lookup(self) -> bool:
+
+        cache = CACHE.get()
+
+        if cache is None:
+            self.key = None
+
+            return False
+
+        self.key = cache.key(self)
+
+        result = cache.load(self.key, index=self.data.index)
+
+        if result is None:
+            return False
+
+        self.result = conform(result)
+
+        return True
+
+    def commit(self) -> None:
+
+        cache = CACHE.get()
+
+        if (cache is not None) and (self.key is not None):
+            cache.save(self.key, self.result)
+
+    def seed(self) -> None:
+
+        if (self.kernel is None) or self.kernel.seeded:
+            return
+
+        if any(feature.result is None for feature in self.features):
+            raise RuntimeError(
+                f'Features of {self} must be calculated before updating it.'
+            )
+
+        self.kernel.seed(
+            *(np.asarray(feature.result, dtype=float) for feature in self.features)
+        )
+
+    def advance(self, data: pd.DataFrame, materialize: bool = True) -> 'Feature':
+
         self.data = data
 
-        data[self.name] = self.result = self.calculator(self)
+        profiler = PROFILER.get()
+        start = profiler.start() if profiler is not None else None
+
+        if self.kernel is not None:
+            self.result = conform(
+                pd.Series(
+                    self.kernel.update(
+                        *(np.asarray(feature.result) for feature in self.features)
+                    ),
+                    index=data.index
+                )
+            )
+
+        elif self.calculator is None:
+            raise ValueError(f'Feature calculator of {self} is not defined.')
+
+        elif self.lookback != 0:
+            raise ValueError(
+                f'{self} has no update kernel and depends on previous rows, '
+                f'so it cannot be updated with new rows only. '
+                f'Define a kernel, or a lookback of 0 for row-wise features.'
+            )
+
+        else:
+            self.result = conform(self.calculator(self))
+
+        if profiler is not None:
+            profiler.record(self, start)
+
+        if materialize:
+            data[self.name] = self.materialized
+
+        return self
+
+    def update(self, data: pd.DataFrame, materialize: bool = True) -> 'Feature':
+
+        features = self.dependencies
+
+        for feature in features:
+            feature.seed()
+
+        for feature in features:
+            feature.advance(data, materialize=materialize)
+
+        return self
+
+    def calculate(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            store: ResultStore = None,
+            cache: ResultCache = None,
+            profiler: Profiler = None
+    ) -> 'Feature':
+
+        with storing(store), caching(cache), profiling(profiler):
+            features = required_features(
+                self.dependencies, [self], data=data,
+                cached=cached, override=override
+            )
+
+            for feature in features:
+                feature.evaluate(
+                    data, cached=cached, override=override and (feature is self)
+                )
 
         return self
 
@@ -116,9 +361,185 @@ class Feature:
 
         self.result = None
         self.data = None
+        self.restored = None
+
+        if self.kernel is not None:
+            self.kernel.reset()
+
+@contextmanager
+def detached(features: Iterable[Feature]) -> Generator[None, None, None]:
+
+    states = [
+        (feature, feature.kernel, feature.data, feature.result, feature.key, feature.restored)
+        for feature in features
+    ]
+
+    for feature, kernel, *_ in states:
+        feature.kernel = deepcopy(kernel)
+        feature.clear()
+
+    try:
+        yield
+
+    finally:
+        for feature, kernel, data, result, key, restored in states:
+            feature.kernel = kernel
+            feature.data = data
+            feature.result = result
+            feature.key = key
+            feature.restored = restored
+
+def sort_features(features: Iterable[Feature]) -> list[Feature]:
+
+    order = []
+    visited = set()
+
+    for root in features:
+        if root.id in visited:
+            continue
+
+        visited.add(root.id)
+
+        active = {root.id}
+        stack = [(root, iter(root.features))]
+
+        while stack:
+            feature, children = stack[-1]
+
+            for child in children:
+                if child.id in active:
+                    raise ValueError(
+                        f'Cyclic dependency between {feature} and {child}.'
+                    )
+
+                if child.id not in visited:
+                    visited.add(child.id)
+                    active.add(child.id)
+                    stack.append((child, iter(child.features)))
+
+                    break
+
+            else:
+                stack.pop()
+                active.discard(feature.id)
+                order.append(feature)
+
+    return order
+
+def required_features(
+        features: list[Feature],
+        targets: Iterable[Feature],
+        data: pd.DataFrame,
+        cached: bool = True,
+        override: bool = False
+) -> list[Feature]:
+
+    targets = {feature.id for feature in targets}
+    required = set(targets)
+
+    selected = []
+
+    for feature in reversed(features):
+        if feature.id not in required:
+            continue
+
+        selected.append(feature)
+
+        if not feature.resolved(
+            data, cached=cached,
+            override=override and (feature.id in targets)
+        ):
+            required.update(f.id for f in feature.features)
+
+    selected.reverse()
+
+    return selected
+
+def level_features(features: list[Feature]) -> list[list[Feature]]:
+
+    depths: dict[str, int] = {}
+    levels: list[list[Feature]] = []
+
+    for feature in features:
+        depth = max(
+            (depths[f.id] + 1 for f in feature.features if f.id in depths),
+            default=0
+        )
+
+        depths[feature.id] = depth
+
+        if depth == len(levels):
+            levels.append([])
+
+        levels[depth].append(feature)
+
+    return levels
+
+def merge_key(feature: Feature, groups: dict[str, int]) -> tuple:
+
+    params = arguments(feature) if registered(feature) else {}
+
+    if feature.features and (len(params) == len(parameters(type(feature)))):
+        name = None
+
+    else:
+        name = feature.name
+        params = feature.kwargs
+
+    return (
+        type(feature),
+        name,
+        repr(sorted(
+            (key, groups.get(value.id, value.id) if isinstance(value, Feature) else value)
+            for key, value in params.items()
+        )),
+        tuple(groups[f.id] for f in feature.features)
+    )
+
+def merge_features(
+        features: list[Feature],
+        targets: Iterable[Feature] = ()
+) -> dict[str, Feature]:
+
+    targets = {feature.id for feature in targets}
+
+    groups: dict[str, int] = {}
+    keys: dict[tuple, int] = {}
+    members: list[list[Feature]] = []
+
+    for feature in features:
+        key = merge_key(feature, groups)
+
+        if key not in keys:
+            keys[key] = len(members)
+            members.append([])
+
+        members[keys[key]].append(feature)
+        groups[feature.id] = keys[key]
+
+    merged = {}
+
+    for group in members:
+        canonical = next((f for f in group if f.id in targets), group[0])
+
+        for feature in group:
+            merged[feature.id] = canonical
+
+    for feature in {f.id: f for f in merged.values()}.values():
+        feature.features = [merged[f.id] for f in feature.features]
+
+        for name, value in list(vars(feature).items()):
+            if isinstance(value, Feature) and (value.id in merged):
+                setattr(feature, name, merged[value.id])
+
+    return merged
 
 class Column(Feature):
 
     def __init__(self, name: str) -> None:
 
-        super().__init__(name=name, calculator=lambda f: f.data[self.name])
+        super().__init__(
+            name=name, calculator=lambda f: f.data[self.name], lookback=0
+        )
+
+register(Column)
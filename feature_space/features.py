@@ -4,6 +4,17 @@ import numpy as np
 import pandas as pd
 
 from feature_space.feature import Feature, Column
+from feature_space.groups import grouped, fill_from, index_of
+from feature_space.fused import rolling, MEAN, DEVIATION, SUM
+from feature_space.spec import register
+from feature_space.compiled import (
+    backend, smoothed_true_range, super_trend_signal, liquidity_spike_scores,
+    PANDAS, NUMBA
+)
+from feature_space.stream import (
+    Difference, RollingSum, RollingMean, RollingStd,
+    ExponentialMean, RelativeStrength, AverageTrueRange, Window
+)
 
 __all__ = (
     'EMA',
@@ -29,20 +40,116 @@ __all__ = (
 
 CLOSE, HIGH, LOW = 'Close', 'High', 'Low'
 
-def average_true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+def exponential_lookback(alpha: float) -> int:
+
+    return int(np.ceil(np.log(np.finfo(float).eps) / np.log(1 - alpha)))
+
+SMA_METHOD, WILDER_METHOD, EMA_METHOD = 'sma', 'wilder', 'ema'
+
+RSI_METHODS = (SMA_METHOD, WILDER_METHOD)
+ATR_METHODS = (WILDER_METHOD, EMA_METHOD)
+
+def smoothing_alpha(span: int, method: str = WILDER_METHOD) -> float:
+
+    if method not in ATR_METHODS:
+        raise ValueError(
+            f'method must be one of {ATR_METHODS}, not {method!r}.'
+        )
+
+    return 1 / span if method == WILDER_METHOD else 2 / (span + 1)
+
+def align(
+        values: pd.Series | np.ndarray,
+        target: pd.Series | np.ndarray
+) -> pd.Series | np.ndarray:
+
+    index = index_of(target)
+
+    if isinstance(values, pd.Series) and (index is not None):
+        return values if values.index.equals(index) else values.reindex(index)
+
+    if len(values) != len(target):
+        raise ValueError(
+            f'Cannot align values of length {len(values)} '
+            f'with values of length {len(target)} without an index.'
+        )
+
+    return values
+
+def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+
+    high = align(high, close)
+    low = align(low, close)
+
+    previous = np.asarray(grouped(close, lambda s: s.shift()), dtype=float)
+
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+
+    return pd.Series(
+        np.fmax(
+            high - low,
+            np.fmax(np.abs(high - previous), np.abs(low - previous))
+        ),
+        index=index_of(close)
+    )
+
+def average_true_range(
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        span: int = 14,
+        method: str = WILDER_METHOD
+) -> pd.Series:
+
+    alpha = smoothing_alpha(span, method)
+
+    high = align(high, close)
+    low = align(low, close)
+
+    if backend() == NUMBA:
+        return pd.Series(
+            smoothed_true_range(high, low, close, span=span, alpha=alpha),
+            index=index_of(close)
+        )
 
-    atr_data = pd.DataFrame(
-        {HIGH: high, LOW: low, CLOSE: close},
-        index=close.index
+    return grouped(
+        true_range(high, low, close),
+        lambda s: s.ewm(alpha=alpha, adjust=False, min_periods=span).mean()
     )
 
-    atr_data['High_Low'] = atr_data[HIGH] - atr_data[LOW]
-    atr_data['High_Previous_Close'] = abs(atr_data[HIGH] - atr_data[CLOSE].shift())
-    atr_data['Low_Previous_Close'] = abs(atr_data[LOW] - atr_data[CLOSE].shift())
+def relative_strength_index(
+        change: pd.Series,
+        span: int = 14,
+        method: str = SMA_METHOD
+) -> pd.Series:
+
+    if method not in RSI_METHODS:
+        raise ValueError(
+            f'method must be one of {RSI_METHODS}, not {method!r}.'
+        )
+
+    values = np.asarray(change, dtype=float)
+
+    gain = pd.Series(np.where(values > 0, values, 0.0), index=index_of(change))
+    loss = pd.Series(np.where(values < 0, -values, 0.0), index=index_of(change))
+
+    if method == WILDER_METHOD:
+        avg_gain, avg_loss = (
+            grouped(
+                values,
+                lambda s: s.ewm(alpha=1 / span, adjust=False, min_periods=span).mean()
+            )
+            for values in (gain, loss)
+        )
 
-    return atr_data[
-        ['High_Low', 'High_Previous_Close', 'Low_Previous_Close']
-    ].max(axis=1).mean()
+    else:
+        avg_gain, avg_loss = (
+            grouped(values, lambda s: s.rolling(window=span).mean())
+            for values in (gain, loss)
+        )
+
+    return 100 - (100 / (1 + (avg_gain / avg_loss)))
 
 def super_trend(
         data: pd.Series,
@@ -51,8 +158,14 @@ def super_trend(
         factor: int = 3
 ) -> pd.Series:
 
-    rolling_mean = data.rolling(span).mean()
-    rolling_mean = rolling_mean.fillna(rolling_mean.iloc[span - 1])
+    if backend() != PANDAS:
+        return pd.Series(
+            super_trend_signal(data, atr, span=span, factor=factor),
+            index=index_of(data)
+        )
+
+    rolling_mean = grouped(data, lambda s: s.rolling(span).mean())
+    rolling_mean = fill_from(rolling_mean, span - 1)
 
     upper_band = rolling_mean + (factor * atr)
     lower_band = rolling_mean - (factor * atr)
@@ -61,9 +174,16 @@ def super_trend(
 
     return pd.Series(
         np.select(conditions, [1, -1], default=0),
-        index=data.index
+        index=index_of(data)
     )
 
+def flips(f1: pd.Series, f2: pd.Series) -> pd.Series:
+
+    return pd.Series(
+        (f1 > f2) !=
+        (grouped(f1, lambda s: s.shift(1)) > grouped(f2, lambda s: s.shift(1)))
+    ).astype(int)
+
 def liquidity_spikes(
         data: pd.Series,
         span: int = 20,
@@ -74,8 +194,16 @@ def liquidity_spikes(
     if not isinstance(data, pd.Series):
         data = pd.Series(data)
 
-    rolling_average = data.rolling(span, min_periods=1).mean()
-    rolling_std = data.rolling(span, min_periods=1).std()
+    if backend() != PANDAS:
+        return pd.Series(
+            liquidity_spike_scores(
+                data, span=span, threshold=z_score_threshold, gradual=gradual
+            ),
+            index=data.index
+        )
+
+    rolling_average = grouped(data, lambda s: s.rolling(span, min_periods=1).mean())
+    rolling_std = grouped(data, lambda s: s.rolling(span, min_periods=1).std())
 
     rolling_average = rolling_average.fillna(0)
     rolling_std = rolling_std.fillna(0)
@@ -83,8 +211,7 @@ def liquidity_spikes(
     z_scores = (data - rolling_average) / rolling_std
 
     if gradual:
-        abnormal_spikes = z_scores
-        abnormal_spikes.fillna(abnormal_spikes.iloc[1], inplace=True)
+        abnormal_spikes = fill_from(z_scores, 1)
 
     else:
         abnormal_spikes = pd.Series(
@@ -105,7 +232,9 @@ class Change(Feature):
         super().__init__(
             name=name or f'{self.feature.name}_Change',
             features=[self.feature],
-            calculator=lambda f: self.feature.result.diff()
+            calculator=lambda f: grouped(self.feature.result, lambda s: s.diff()),
+            kernel=Difference(),
+            lookback=1
         )
 
 class MiddleBollingerBand(Feature):
@@ -119,8 +248,10 @@ class MiddleBollingerBand(Feature):
 
         super().__init__(
             name=name or f'{self.feature.name}_Middle_Bollinger_Band_{span}',
+            kwargs=dict(span=span),
             features=[self.sma],
-            calculator=lambda f: self.sma.result
+            calculator=lambda f: self.sma.result,
+            lookback=0
         )
 
 class STD(Feature):
@@ -129,14 +260,15 @@ class STD(Feature):
 
         self.feature = feature
         self.span = span
+        self.window = (DEVIATION, span, span)
 
         super().__init__(
             name=name or f'{feature.name}_STD_{self.span}',
             kwargs=dict(span=span),
             features=[self.feature],
-            calculator=lambda f: (
-                self.feature.result.rolling(window=span).std()
-            )
+            calculator=lambda f: rolling(self),
+            kernel=RollingStd(span),
+            lookback=span - 1
         )
 
 class BottomBollingerBand(Feature):
@@ -149,7 +281,8 @@ class BottomBollingerBand(Feature):
         super().__init__(
             name=name or f'{self.std.feature.name}_Bottom_Bollinger_Band',
             features=[self.band, self.std],
-            calculator=lambda f: self.band.result - (2 * self.std.result)
+            calculator=lambda f: self.band.result - (2 * self.std.result),
+            lookback=0
         )
 
 class TopBollingerBand(Feature):
@@ -162,7 +295,8 @@ class TopBollingerBand(Feature):
         super().__init__(
             name=name or f'{self.std.feature.name}_Top_Bollinger_Band',
             features=[self.band, self.std],
-            calculator=lambda f: self.band.result + (2 * self.std.result)
+            calculator=lambda f: self.band.result + (2 * self.std.result),
+            lookback=0
         )
 
 class Volatility(Feature):
@@ -174,7 +308,8 @@ class Volatility(Feature):
         super().__init__(
             name=name or f'{self.change.feature.name}_Volatility',
             features=[self.change],
-            calculator=lambda f: self.change.result.abs()
+            calculator=lambda f: np.abs(self.change.result),
+            lookback=0
         )
 
 class TRAMA(Feature):
@@ -188,10 +323,12 @@ class TRAMA(Feature):
 
         super().__init__(
             name=name or f'{self.volatility.name}_TRAMA_{self.span}',
+            kwargs=dict(span=span),
             features=[self.volatility, self.sma],
             calculator=lambda f: (
                 self.sma.result + (self.volatility.result * 0.1)
-            )
+            ),
+            lookback=0
         )
 
 class Momentum(Feature):
@@ -200,13 +337,15 @@ class Momentum(Feature):
 
         self.change = change
         self.span = span
+        self.window = (SUM, span, 1)
 
         super().__init__(
             name=name or f'{self.change.feature.name}_Momentum_{self.span}',
+            kwargs=dict(span=span),
             features=[self.change],
-            calculator=lambda f: (
-                self.change.result.rolling(window=self.span, min_periods=1).sum()
-            )
+            calculator=lambda f: rolling(self),
+            kernel=RollingSum(span, min_periods=1),
+            lookback=span - 1
         )
 
 class MomentumOscillator(Feature):
@@ -218,33 +357,48 @@ class MomentumOscillator(Feature):
 
         super().__init__(
             name=name or f'{self.feature.name}_Momentum_Oscillator_{self.span}',
+            kwargs=dict(span=span),
             features=[self.feature],
             calculator=lambda f: (
                 (
-                    self.feature.result.diff(self.span) /
-                    self.feature.result.shift(self.span)
+                    grouped(self.feature.result, lambda s: s.diff(self.span)) /
+                    grouped(self.feature.result, lambda s: s.shift(self.span))
                 ) * 100
-            )
+            ),
+            kernel=Difference(span, relative=True),
+            lookback=span
         )
 
 class RSI(Feature):
 
-    def __init__(self, change: Change, span: int, name: str = None) -> None:
+    def __init__(
+            self,
+            change: Change,
+            span: int,
+            method: str = SMA_METHOD,
+            name: str = None
+    ) -> None:
 
         self.change = change
         self.span = span
+        self.method = method
 
         super().__init__(
-            name=name or f'{self.change.feature.name}_RSI_{self.span}',
+            name=name or (
+                f'{self.change.feature.name}_'
+                f'{'Wilder_' if method == WILDER_METHOD else ''}'
+                f'RSI_{self.span}'
+            ),
+            kwargs=dict(span=span, method=method),
             features=[self.change],
-            calculator=lambda f: (
-                (gain := self.change.result.apply(lambda x: x if x > 0 else 0)),
-                (loss := self.change.result.apply(lambda x: abs(x) if x < 0 else 0)),
-                (avg_gain := gain.rolling(window=self.span).mean()),
-                (avg_loss := loss.rolling(window=self.span).mean()),
-                (relative_strength := avg_gain / avg_loss),
-                100 - (100 / (1 + relative_strength))
-            )[-1]
+            calculator=lambda f: relative_strength_index(
+                self.change.result, span=self.span, method=self.method
+            ),
+            kernel=RelativeStrength(span, wilder=method == WILDER_METHOD),
+            lookback=(
+                exponential_lookback(1 / span)
+                if method == WILDER_METHOD else span - 1
+            )
         )
 
 class EMA(Feature):
@@ -256,10 +410,14 @@ class EMA(Feature):
 
         super().__init__(
             name=name or f'{feature.name}_EMA_{self.span}',
+            kwargs=dict(span=span),
             features=[self.feature],
-            calculator=lambda f: (
-                self.feature.result.ewm(span=self.span, adjust=False).mean()
-            )
+            calculator=lambda f: grouped(
+                self.feature.result,
+                lambda s: s.ewm(span=self.span, adjust=False).mean()
+            ),
+            kernel=ExponentialMean.from_span(span),
+            lookback=exponential_lookback(2 / (span + 1))
         )
 
 class SMA(Feature):
@@ -268,13 +426,15 @@ class SMA(Feature):
 
         self.feature = feature
         self.span = span
+        self.window = (MEAN, span, span)
 
         super().__init__(
             name=name or f'{self.feature.name}_SMA_{self.span}',
+            kwargs=dict(span=span),
             features=[self.feature],
-            calculator=lambda f: (
-                self.feature.result.rolling(window=self.span).mean()
-            )
+            calculator=lambda f: rolling(self),
+            kernel=RollingMean(span),
+            lookback=span - 1
         )
 
 class MACD(Feature):
@@ -287,7 +447,8 @@ class MACD(Feature):
         super().__init__(
             name=name or f'{self.f1.name}_{self.f2.name}_MACD',
             features=[self.f1, self.f2],
-            calculator=lambda f: self.f1.result - self.f2.result
+            calculator=lambda f: self.f1.result - self.f2.result,
+            lookback=0
         )
 
 class Flips(Feature):
@@ -299,13 +460,13 @@ class Flips(Feature):
 
         super().__init__(
             name=name or f'{self.f1.name}_{self.f2.name}_Flips',
-            features=[self.f1, self.f1],
-            calculator=lambda f: (
-                pd.Series(
-                    (self.f1.result > self.f2.result) !=
-                    (self.f1.result.shift(1) > self.f2.result.shift(1))
-                ).astype(int)
-            )
+            features=[self.f1, self.f2],
+            calculator=lambda f: flips(self.f1.result, self.f2.result),
+            kernel=Window(
+                1, lambda f1, f2: flips(pd.Series(f1), pd.Series(f2)).to_numpy()
+            ),
+            lookback=1,
+            signal=True
         )
 
 class MACDSignal(Feature):
@@ -314,13 +475,15 @@ class MACDSignal(Feature):
 
         self.macd = macd
         self.span = span
+        self.window = (MEAN, span, 1)
 
         super().__init__(
             name=name or f"{self.macd.name}_Signal_{self.span}",
+            kwargs=dict(span=span),
             features=[self.macd],
-            calculator=lambda f: (
-                self.macd.result.rolling(window=self.span, min_periods=1).mean()
-            )
+            calculator=lambda f: rolling(self),
+            kernel=RollingMean(span, min_periods=1),
+            lookback=span - 1
         )
 
 class MACDHistogram(Feature):
@@ -331,10 +494,11 @@ class MACDHistogram(Feature):
 
         super().__init__(
             name=name or f'{macd_signal.name}_Histogram',
-            features=[self.macd_signal],
+            features=[self.macd_signal, self.macd_signal.macd],
             calculator=lambda f: (
                     self.macd_signal.macd.result - self.macd_signal.result
-            )
+            ),
+            lookback=0
         )
 
 class LiquiditySpikes(Feature):
@@ -359,6 +523,9 @@ class LiquiditySpikes(Feature):
                 f'Liquidity_Spikes_'
                 f'{self.span}_{self.z_score_threshold}'
             ),
+            kwargs=dict(
+                span=span, z_score_threshold=z_score_threshold, gradual=gradual
+            ),
             features=[self.volume],
             calculator=lambda f: (
                 liquidity_spikes(
@@ -367,26 +534,52 @@ class LiquiditySpikes(Feature):
                     z_score_threshold=self.z_score_threshold,
                     span=span
                 )
-            )
+            ),
+            kernel=Window(
+                span, lambda volume: liquidity_spikes(
+                    pd.Series(volume),
+                    gradual=gradual,
+                    z_score_threshold=self.z_score_threshold,
+                    span=span
+                ).to_numpy()
+            ),
+            lookback=span - 1,
+            signal=not gradual
         )
 
 class ATR(Feature):
 
     def __init__(
-            self, high: Column, low: Column, close: Column, name: str = None) -> None:
+            self,
+            high: Column,
+            low: Column,
+            close: Column,
+            span: int = 14,
+            method: str = WILDER_METHOD,
+            name: str = None
+    ) -> None:
 
         self.high = high
         self.low = low
         self.close = close
+        self.span = span
+        self.method = method
 
         super().__init__(
-            name=name or f'ATR',
+            name=name or (
+                f"{'EMA_' if method == EMA_METHOD else ''}ATR_{span}"
+            ),
+            kwargs=dict(span=span, method=method),
             features=[self.high, self.low, self.close],
             calculator=lambda f: average_true_range(
                 high=self.high.result,
                 low=self.low.result,
-                close=self.close.result
-            )
+                close=self.close.result,
+                span=self.span,
+                method=self.method
+            ),
+            kernel=AverageTrueRange(span, wilder=method == WILDER_METHOD),
+            lookback=exponential_lookback(smoothing_alpha(span, method)) + 1
         )
 
 class SuperTrend(Feature):
@@ -406,10 +599,41 @@ class SuperTrend(Feature):
         self.factor = factor
 
         super().__init__(
-            name=name or f'{self.feature.name}_Super_Trend_{self.span}_{self.factor}',
+            name=name or f'{self.feature.name}_{self.atr.name}_Super_Trend_{self.span}_{self.factor}',
+            kwargs=dict(span=span, factor=factor),
             features=[self.atr, self.feature],
             calculator=lambda f: super_trend(
                 data=self.feature.result, atr=self.atr.result,
                 span=self.span, factor=self.factor
-            )
+            ),
+            kernel=Window(
+                span, lambda atr, data: super_trend(
+                    data=pd.Series(data), atr=pd.Series(atr),
+                    span=span, factor=factor
+                ).to_numpy()
+            ),
+            lookback=span - 1,
+            signal=True
         )
+
+register(
+    Change,
+    MiddleBollingerBand,
+    STD,
+    BottomBollingerBand,
+    TopBollingerBand,
+    Volatility,
+    TRAMA,
+    Momentum,
+    MomentumOscillator,
+    RSI,
+    EMA,
+    SMA,
+    MACD,
+    Flips,
+    MACDSignal,
+    MACDHistogram,
+    LiquiditySpikes,
+    ATR,
+    SuperTrend
+)
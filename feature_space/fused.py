@@ -0,0 +1,256 @@
+# fused.py
+
+import threading
+from weakref import ref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, Any
+
+import numpy as np
+import pandas as pd
+
+from feature_space.groups import Groups, GROUPS, grouped, arrange, index_of
+
+__all__ = [
+    "rolling",
+    "rolling_windows",
+    "window_arrays",
+    "RollingFamily",
+    "fuse_features",
+    "fusing",
+    "FUSION"
+]
+
+MEAN, DEVIATION, SUM = 'mean', 'std', 'sum'
+
+Window = tuple[str, int, int]
+
+def window_arrays(
+        values: np.ndarray,
+        windows: list[Window],
+        starts: np.ndarray | None = None,
+        block: int = 16384
+) -> dict[Window, np.ndarray]:
+
+    windows = list(dict.fromkeys(windows))
+
+    length = len(values)
+    overlap = max((span for _, span, _ in windows), default=1) - 1
+    deviation = any(statistic == DEVIATION for statistic, _, _ in windows)
+
+    if (starts is not None) and not starts.any():
+        starts = None
+
+    results = {window: np.empty(length) for window in windows}
+
+    for begin in range(0, length, block):
+        end = min(begin + block, length)
+        first = max(begin - overlap, 0)
+
+        segment = values[first:end]
+
+        valid = ~np.isnan(segment)
+        shift = segment[valid].mean() if valid.any() else 0.0
+        centered = np.where(valid, segment - shift, 0.0)
+
+        sums = np.concatenate([[0.0], np.cumsum(centered)])
+        counts = np.concatenate([[0], np.cumsum(valid)])
+        squares = (
+            np.concatenate([[0.0], np.cumsum(centered * centered)])
+            if deviation else None
+        )
+
+        high = slice(begin - first + 1, end - first + 1)
+
+        for window in windows:
+            statistic, span, min_periods = window
+
+            start = begin - first + 1 - span
+
+            if (starts is None) and (start >= 0):
+                low = slice(start, start + end - begin)
+
+            else:
+                low = np.arange(start, start + end - begin)
+
+                if starts is not None:
+                    low = np.maximum(low, starts[begin:end] - first)
+
+                low = np.maximum(low, 0)
+
+            count = counts[high] - counts[low]
+            total = sums[high] - sums[low]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if statistic == MEAN:
+                    result = shift + total / count
+
+                elif statistic == SUM:
+                    result = total + shift * count
+
+                elif statistic == DEVIATION:
+                    variance = (
+                        (squares[high] - squares[low]) - total * total / count
+                    ) / (count - 1)
+
+                    result = np.sqrt(np.maximum(variance, 0.0))
+                    result[count < 2] = np.nan
+
+                else:
+                    raise ValueError(
+                        f'Unknown rolling statistic {statistic!r}.'
+                    )
+
+            result[count < max(min_periods, 1)] = np.nan
+
+            results[window][begin:end] = result
+
+    return results
+
+def rolling_windows(
+        data: pd.Series,
+        windows: list[Window],
+        groups: Groups | None = None
+) -> dict[Window, pd.Series]:
+
+    values = np.asarray(data, dtype=float)
+
+    order, starts = arrange(groups, len(values))
+
+    if order is not None:
+        values = values[order]
+
+    results = window_arrays(values, windows, starts=starts)
+
+    if order is not None:
+        for result in results.values():
+            result[order] = result.copy()
+
+    return {
+        window: pd.Series(
+            result, index=index_of(data), name=getattr(data, 'name', None)
+        )
+        for window, result in results.items()
+    }
+
+def rolling(feature: Any) -> pd.Series:
+
+    statistic, span, min_periods = feature.window
+
+    data = feature.features[0].result
+
+    family = (FUSION.get() or {}).get(feature.id)
+
+    if family is None:
+        return grouped(
+            data,
+            lambda s: getattr(
+                s.rolling(window=span, min_periods=min_periods), statistic
+            )()
+        )
+
+    return family.result(feature, data)
+
+class RollingFamily:
+
+    def __init__(self, windows: list[Window]) -> None:
+
+        self.members = list(windows)
+        self.windows = list(dict.fromkeys(windows))
+
+        self.lock = threading.Lock()
+        self.results: dict[int, tuple] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+
+        return dict(windows=self.members)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+
+        self.__init__(**state)
+
+    def result(self, feature: Any, data: pd.Series) -> pd.Series:
+
+        groups = GROUPS.get()
+        key = id(data)
+
+        with self.lock:
+            entry = self.results.get(key)
+
+            if (
+                (entry is None) or
+                (entry[0]() is not data) or
+                (entry[1] is not groups) or
+                (feature.window not in entry[2])
+            ):
+                entry = (
+                    ref(data, lambda reference: self.discard(key, reference)),
+                    groups,
+                    rolling_windows(data, self.windows, groups),
+                    Counter(self.members)
+                )
+
+                self.results[key] = entry
+
+            results, remaining = entry[2], entry[3]
+
+            result = results[feature.window]
+
+            remaining[feature.window] -= 1
+
+            if remaining[feature.window] <= 0:
+                del results[feature.window]
+
+            if not results:
+                del self.results[key]
+
+        return result
+
+    def discard(self, key: int, reference: ref) -> None:
+
+        entry = self.results.get(key)
+
+        if (entry is not None) and (entry[0] is reference):
+            self.results.pop(key, None)
+
+FUSION: ContextVar[dict[str, RollingFamily] | None] = ContextVar('FUSION', default=None)
+
+@contextmanager
+def fusing(
+        fusion: dict[str, RollingFamily] | None
+) -> Generator[dict[str, RollingFamily] | None, None, None]:
+
+    if fusion is None:
+        yield FUSION.get()
+
+        return
+
+    token = FUSION.set(fusion)
+
+    try:
+        yield fusion
+
+    finally:
+        FUSION.reset(token)
+
+def fuse_features(features: list[Any]) -> dict[str, RollingFamily]:
+
+    members: dict[str, list[Any]] = {}
+
+    for feature in features:
+        if getattr(feature, 'window', None) is not None:
+            members.setdefault(feature.features[0].id, []).append(feature)
+
+    fusion = {}
+
+    for family in members.values():
+        if len({feature.window for feature in family}) < 2:
+            continue
+
+        fused = RollingFamily([feature.window for feature in family])
+
+        for feature in family:
+            fusion[feature.id] = fused
+
+    return fusion
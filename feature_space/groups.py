@@ -0,0 +1,168 @@
+# groups.py
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Generator, Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "Groups",
+    "grouping",
+    "grouped",
+    "fill_from",
+    "anchors_of",
+    "index_of",
+    "arrange",
+    "GROUPS"
+]
+
+@dataclass
+class Groups:
+
+    codes: np.ndarray = field(repr=False)
+    count: int = 0
+    contiguous: bool = True
+
+    @classmethod
+    def from_keys(cls, keys: Any) -> "Groups":
+
+        codes, uniques = pd.factorize(keys, sort=False)
+
+        return cls(
+            codes=codes,
+            count=len(uniques),
+            contiguous=bool(np.all(np.diff(codes) >= 0))
+        )
+
+    @classmethod
+    def from_data(cls, data: pd.DataFrame, by: Any) -> "Groups":
+
+        if isinstance(by, str) and (by in data.index.names):
+            keys = data.index.get_level_values(by)
+
+        elif isinstance(by, str):
+            keys = data[by]
+
+        else:
+            keys = by
+
+        if len(keys) != len(data):
+            raise ValueError(
+                f'Group keys of length {len(keys)} do not match '
+                f'data of length {len(data)}.'
+            )
+
+        return cls.from_keys(keys)
+
+    @property
+    def positions(self) -> np.ndarray:
+
+        return pd.Series(self.codes).groupby(self.codes).cumcount().to_numpy()
+
+    def apply(
+            self,
+            data: pd.Series,
+            operation: Callable[[Any], pd.Series]
+    ) -> pd.Series:
+
+        series = pd.Series(data.to_numpy(), copy=False)
+
+        result = operation(series.groupby(self.codes, sort=False))
+
+        if isinstance(result.index, pd.MultiIndex):
+            result = result.droplevel(0)
+
+        if not self.contiguous:
+            result = result.sort_index()
+
+        return pd.Series(result.to_numpy(), index=data.index, name=data.name)
+
+GROUPS: ContextVar[Groups | None] = ContextVar('GROUPS', default=None)
+
+@contextmanager
+def grouping(groups: Groups | None) -> Generator[Groups | None, None, None]:
+
+    if groups is None:
+        yield GROUPS.get()
+
+        return
+
+    token = GROUPS.set(groups)
+
+    try:
+        yield groups
+
+    finally:
+        GROUPS.reset(token)
+
+def index_of(data: pd.Series | np.ndarray) -> pd.Index | None:
+
+    return data.index if isinstance(data, pd.Series) else None
+
+def grouped(
+        data: pd.Series | np.ndarray,
+        operation: Callable[[Any], pd.Series]
+) -> pd.Series | np.ndarray:
+
+    if isinstance(data, np.ndarray):
+        return np.asarray(grouped(pd.Series(data, copy=False), operation))
+
+    groups = GROUPS.get()
+
+    if groups is None:
+        return operation(data)
+
+    return groups.apply(data, operation)
+
+def arrange(
+        groups: Groups | None,
+        length: int
+) -> tuple[np.ndarray | None, np.ndarray]:
+
+    if groups is None:
+        return None, np.zeros(length, dtype=np.int64)
+
+    codes = groups.codes
+    order = None
+
+    if not groups.contiguous:
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+
+    starts = np.zeros(length, dtype=np.int64)
+    changes = np.flatnonzero(np.diff(codes)) + 1
+    starts[changes] = changes
+
+    return order, np.maximum.accumulate(starts)
+
+def fill_from(data: pd.Series | np.ndarray, position: int) -> pd.Series | np.ndarray:
+
+    groups = GROUPS.get()
+
+    if isinstance(data, np.ndarray):
+        if data.dtype.kind not in 'fc':
+            return data
+
+        if groups is None:
+            return np.where(np.isnan(data), data[position], data)
+
+        return np.where(np.isnan(data), anchors_of(groups, data, position), data)
+
+    if groups is None:
+        return data.fillna(data.iloc[position])
+
+    return data.fillna(
+        pd.Series(anchors_of(groups, data.to_numpy(), position), index=data.index)
+    )
+
+def anchors_of(groups: Groups, values: np.ndarray, position: int) -> np.ndarray:
+
+    selected = groups.positions == position
+
+    anchors = np.full(groups.count, np.nan)
+    anchors[groups.codes[selected]] = values[selected]
+
+    return anchors[groups.codes]
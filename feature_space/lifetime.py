@@ -0,0 +1,127 @@
+# lifetime.py
+
+from dataclasses import dataclass, field
+from typing import Iterable, Any
+
+import numpy as np
+import pandas as pd
+
+from feature_space.storage import ColumnStorage
+from feature_space.compiled import conform
+
+__all__ = [
+    "ResultMemory",
+    "Lifetimes",
+    "nbytes"
+]
+
+def nbytes(result: pd.Series | np.ndarray | None) -> int:
+
+    if result is None:
+        return 0
+
+    values = np.asarray(result)
+
+    base = values
+
+    while isinstance(base, np.ndarray):
+        if isinstance(base, np.memmap):
+            return 0
+
+        base = base.base
+
+    return values.nbytes
+
+@dataclass
+class ResultMemory:
+
+    current: int = 0
+    peak: int = 0
+    allocated: int = 0
+    released: int = 0
+    spilled: int = 0
+
+    def allocate(self, size: int) -> None:
+
+        self.current += size
+        self.allocated += size
+        self.peak = max(self.peak, self.current)
+
+    def free(self, size: int) -> None:
+
+        self.current -= size
+        self.released += size
+
+@dataclass
+class Lifetimes:
+
+    consumers: dict[str, int] = field(default_factory=dict)
+    targets: set[str] = field(default_factory=set)
+    release: bool = False
+    spill: ColumnStorage | None = field(default=None, repr=False)
+    result_memory: ResultMemory = field(default_factory=ResultMemory)
+    sizes: dict[str, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def count(
+            cls,
+            features: list[Any],
+            targets: Iterable[str],
+            release: bool = False,
+            spill: ColumnStorage = None
+    ) -> "Lifetimes":
+
+        consumers = {feature.id: 0 for feature in features}
+
+        for feature in features:
+            for f in feature.features:
+                if f.id in consumers:
+                    consumers[f.id] += 1
+
+        return cls(
+            consumers=consumers, targets=set(targets),
+            release=release or (spill is not None), spill=spill
+        )
+
+    def retained(self, feature: Any) -> bool:
+
+        return (not self.release) or (feature.id in self.targets)
+
+    def computed(self, feature: Any) -> None:
+
+        size = nbytes(feature.result)
+
+        self.sizes[feature.id] = size
+        self.result_memory.allocate(size)
+
+    def done(self, feature: Any) -> None:
+
+        if not self.release:
+            return
+
+        feature.data = None
+
+        for f in feature.features:
+            if f.id not in self.consumers:
+                continue
+
+            self.consumers[f.id] -= 1
+
+            if (self.consumers[f.id] == 0) and (f.id not in self.targets):
+                self.free(f)
+
+    def free(self, feature: Any) -> None:
+
+        size = self.sizes.pop(feature.id, 0)
+
+        if (self.spill is not None) and (feature.result is not None) and size:
+            self.spill[feature.name] = feature.result
+
+            feature.result = conform(self.spill[feature.name])
+
+            self.result_memory.spilled += size
+
+        else:
+            feature.result = None
+
+        self.result_memory.free(size)
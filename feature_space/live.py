@@ -0,0 +1,264 @@
+# live.py
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from feature_space.compiled import backing
+from feature_space.dtypes import casting
+from feature_space.profiler import Profiler, profiling
+from feature_space.plan import Plan, BATCH
+
+__all__ = [
+    "RingBuffer",
+    "LiveEngine"
+]
+
+@dataclass
+class RingBuffer:
+
+    capacity: int
+    shape: tuple[int, ...] = ()
+    dtype: Any = float
+    values: np.ndarray = field(init=False, repr=False)
+    position: int = field(default=0, init=False)
+    size: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+
+        if self.capacity < 1:
+            raise ValueError(f'capacity must be positive, not {self.capacity}.')
+
+        self.dtype = np.dtype(self.dtype)
+        self.shape = tuple(self.shape)
+
+        self.values = np.empty((2 * self.capacity, *self.shape), dtype=self.dtype)
+
+        if self.dtype.kind in 'fc':
+            self.values.fill(np.nan)
+
+        elif self.dtype.kind in 'mM':
+            self.values.fill(self.dtype.type('NaT'))
+
+    def __len__(self) -> int:
+
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+
+        return self.values.nbytes
+
+    @property
+    def latest(self) -> np.ndarray:
+
+        if self.size == 0:
+            raise IndexError('The ring buffer is empty.')
+
+        latest = self.values[self.position + self.capacity - 1]
+
+        if self.shape:
+            latest.flags.writeable = False
+
+        return latest
+
+    def window(self, size: int = None) -> np.ndarray:
+
+        size = self.size if size is None else min(size, self.size)
+
+        end = self.position + self.capacity
+
+        view = self.values[end - size:end]
+        view.flags.writeable = False
+
+        return view
+
+    def extend(self, values: np.ndarray) -> None:
+
+        values = np.asarray(values)[-self.capacity:]
+
+        count = len(values)
+        start = self.position
+        split = min(count, self.capacity - start)
+
+        for offset in (0, self.capacity):
+            self.values[offset + start:offset + start + split] = values[:split]
+            self.values[offset:offset + count - split] = values[split:]
+
+        self.position = (start + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def clear(self) -> None:
+
+        self.position = 0
+        self.size = 0
+
+@dataclass
+class LiveEngine:
+
+    dataset: Any = field(repr=False)
+    capacity: int | None = None
+    plan: Plan | None = field(default=None, init=False, repr=False)
+    columns: list[str] = field(default_factory=list, init=False)
+    buffer: RingBuffer | None = field(default=None, init=False, repr=False)
+    index: RingBuffer | None = field(default=None, init=False, repr=False)
+    positions: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+
+        plan = self.prepare()
+
+        if self.capacity is None:
+            lookback = plan.lookback
+
+            if lookback is None:
+                raise ValueError(
+                    f'Cannot size the window of {self.dataset.name}, '
+                    f'as not all of its features have a bounded lookback.'
+                )
+
+            self.capacity = max(lookback, 1)
+
+        if self.capacity < 1:
+            raise ValueError(f'capacity must be positive, not {self.capacity}.')
+
+    def __len__(self) -> int:
+
+        return 0 if self.buffer is None else len(self.buffer)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+
+        return self.column(name)
+
+    @property
+    def started(self) -> bool:
+
+        return self.buffer is not None
+
+    @property
+    def nbytes(self) -> int:
+
+        if self.buffer is None:
+            return 0
+
+        return self.buffer.nbytes + self.index.nbytes
+
+    @property
+    def ring(self) -> RingBuffer:
+
+        if self.buffer is None:
+            raise RuntimeError(
+                f'The live engine of {self.dataset.name} must be started '
+                f'with history before it is used.'
+            )
+
+        return self.buffer
+
+    @property
+    def latest(self) -> np.ndarray:
+
+        return self.ring.latest
+
+    def prepare(self) -> Plan:
+
+        self.plan = self.dataset.planned()
+
+        self.columns = self.plan.features_names
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+
+        return self.plan
+
+    def start(
+            self,
+            data: pd.DataFrame,
+            cached: bool = False,
+            profiler: Profiler = None
+    ) -> "LiveEngine":
+
+        output = self.dataset.transform(data, cached=cached, profiler=profiler)
+
+        plan = self.prepare()
+
+        for feature in plan.features:
+            if feature.kernel is not None:
+                feature.kernel.reset()
+
+            feature.seed()
+
+        history = output[self.columns].tail(self.capacity)
+
+        self.buffer = RingBuffer(
+            self.capacity, shape=(len(self.columns),),
+            dtype=np.result_type(*history.dtypes)
+        )
+        self.index = RingBuffer(
+            self.capacity, dtype=np.asarray(history.index).dtype
+        )
+
+        self.buffer.extend(history.to_numpy(dtype=self.buffer.dtype))
+        self.index.extend(np.asarray(history.index))
+
+        return self
+
+    def push(
+            self,
+            data: pd.DataFrame | pd.Series,
+            profiler: Profiler = None
+    ) -> np.ndarray:
+
+        buffer = self.ring
+
+        if self.dataset.planned() is not self.plan:
+            raise RuntimeError(
+                f'The features of {self.dataset.name} changed since '
+                f'the live engine was started, and it must be started again.'
+            )
+
+        if isinstance(data, pd.Series):
+            data = pd.DataFrame(
+                [data.to_numpy()], index=[data.name], columns=data.index
+            )
+
+        if len(data) == 0:
+            return buffer.latest
+
+        dataset = self.dataset
+
+        with backing(dataset.backend), casting(dataset.dtypes), profiling(profiler):
+            results = self.plan.update(data=data, materialize=BATCH)
+
+        rows = np.empty((len(data), len(self.columns)), dtype=buffer.dtype)
+
+        for name, position in self.positions.items():
+            rows[:, position] = np.asarray(results[name])
+
+        buffer.extend(rows)
+        self.index.extend(np.asarray(data.index))
+
+        return buffer.latest
+
+    def window(self, size: int = None) -> np.ndarray:
+
+        return self.ring.window(size)
+
+    def column(self, name: str, size: int = None) -> np.ndarray:
+
+        if name not in self.positions:
+            raise KeyError(f'{name} is not a feature of {self.dataset.name}.')
+
+        return self.window(size)[:, self.positions[name]]
+
+    def frame(self, size: int = None) -> pd.DataFrame:
+
+        return pd.DataFrame(
+            self.window(size), index=pd.Index(self.index.window(size)),
+            columns=self.columns, copy=False
+        )
+
+    def row(self) -> pd.Series:
+
+        return pd.Series(
+            self.latest, index=self.columns, name=self.index.latest, copy=False
+        )
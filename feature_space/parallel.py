@@ -0,0 +1,175 @@
+# parallel.py
+
+import copyreg
+from io import BytesIO
+from contextvars import Context, copy_context
+from typing import Callable, Any
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, wait, FIRST_COMPLETED
+)
+
+import dill
+import pandas as pd
+
+from feature_space.feature import Feature
+from feature_space.groups import Groups, GROUPS, grouping
+from feature_space.compiled import BACKEND, backing, conform
+from feature_space.profiler import Profiler, PROFILER, MISS, measure
+
+__all__ = [
+    "pack",
+    "unpack",
+    "calculate_packed",
+    "offload",
+    "receive",
+    "schedule"
+]
+
+class _Packer(dill.Pickler):
+
+    def __init__(self, file, feature: Feature) -> None:
+
+        super().__init__(file, recurse=True)
+
+        self.feature = feature
+        self.inputs = {f.id for f in feature.features}
+
+    def reducer_override(self, obj):
+
+        if not isinstance(obj, Feature):
+            return NotImplemented
+
+        state = obj.__dict__.copy()
+
+        if obj is self.feature:
+            state['_result'] = None
+            state['_data'] = obj.data[
+                [obj.name] if not obj.features and (obj.name in obj.data) else []
+            ]
+
+        else:
+            state.update(
+                _data=None, calculator=None, kernel=None,
+                _result=obj.result if obj.id in self.inputs else None
+            )
+
+        return copyreg.__newobj__, (type(obj),), state
+
+def pack(feature: Feature) -> bytes:
+
+    file = BytesIO()
+
+    _Packer(file, feature).dump(feature)
+
+    return file.getvalue()
+
+def unpack(payload: bytes) -> Feature:
+
+    return dill.loads(payload)
+
+def _calculate(
+        feature: Feature,
+        groups: Groups = None,
+        backend: str = None,
+        measured: bool = False
+) -> pd.Series | tuple[pd.Series, float, float]:
+
+    with grouping(groups), backing(backend):
+        if measured:
+            return measure(feature.calculator, feature)
+
+        return feature.calculator(feature)
+
+def calculate_packed(
+        payload: bytes,
+        groups: Groups = None,
+        backend: str = None,
+        measured: bool = False
+) -> pd.Series | tuple[pd.Series, float, float]:
+
+    return Context().run(_calculate, unpack(payload), groups, backend, measured)
+
+def offload(
+        feature: Feature,
+        processes: bool = False,
+        measured: bool = False
+) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+
+    if processes:
+        return calculate_packed, (
+            pack(feature), GROUPS.get(), BACKEND.get(), measured
+        )
+
+    if measured:
+        return copy_context().run, (measure, feature.calculator, feature)
+
+    return copy_context().run, (feature.calculator, feature)
+
+def receive(feature: Feature, result: Any, profiler: Profiler = None) -> None:
+
+    if profiler is None:
+        feature.result = conform(result)
+
+        return
+
+    result, wall, cpu = result
+
+    feature.result = conform(result)
+
+    profiler.add(
+        feature, wall=wall, cpu=cpu,
+        cache=MISS if feature.key is not None else None
+    )
+
+def schedule(
+        features: list[Feature],
+        executor: Executor,
+        callback: Callable[[Feature], None] = None
+) -> None:
+
+    pending = {feature.id: feature for feature in features}
+
+    waiting = {
+        feature.id: {f.id for f in feature.features if f.id in pending}
+        for feature in features
+    }
+
+    dependents = {feature.id: [] for feature in features}
+
+    for feature in features:
+        for dependency in waiting[feature.id]:
+            dependents[dependency].append(feature)
+
+    processes = isinstance(executor, ProcessPoolExecutor)
+
+    profiler = PROFILER.get()
+    measured = profiler is not None
+
+    running: dict[Future, Feature] = {}
+
+    def submit(feature: Feature) -> None:
+
+        function, args = offload(feature, processes=processes, measured=measured)
+
+        running[executor.submit(function, *args)] = feature
+
+    for feature in features:
+        if not waiting[feature.id]:
+            submit(feature)
+
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            feature = running.pop(future)
+
+            receive(feature, future.result(), profiler)
+
+            if callback is not None:
+                callback(feature)
+
+            for dependent in dependents[feature.id]:
+                waiting[dependent.id].discard(feature.id)
+
+                if not waiting[dependent.id]:
+                    submit(dependent)
@@ -0,0 +1,431 @@
+# plan.py
+
+import copy
+import asyncio
+from typing import Iterable, Any
+from dataclasses import dataclass, field
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pandas as pd
+
+from feature_space.feature import (
+    Feature, sort_features, required_features, level_features
+)
+from feature_space.parallel import schedule, offload, receive
+from feature_space.fused import RollingFamily, fuse_features
+from feature_space.storage import ColumnStorage
+from feature_space.lifetime import Lifetimes, ResultMemory
+from feature_space.profiler import PROFILER, HIT
+
+__all__ = [
+    "Plan",
+    "MATERIALIZE"
+]
+
+INSERT, BATCH = 'insert', 'batch'
+
+MATERIALIZE = (INSERT, BATCH)
+
+@dataclass
+class Plan:
+
+    features: list[Feature] = field(default_factory=list)
+    targets: list[Feature] = field(default_factory=list)
+    aliases: list[tuple[Feature, Feature]] = field(default_factory=list, repr=False)
+    fusion: dict[str, RollingFamily] = field(default_factory=dict, repr=False)
+    result_memory: ResultMemory | None = field(default=None, repr=False)
+
+    @property
+    def features_names(self) -> list[str]:
+
+        return [f.name for f in self.features] + [alias.name for _, alias in self.aliases]
+
+    @property
+    def targets_ids(self) -> set[str]:
+
+        return {f.id for f in self.targets}
+
+    @property
+    def lookback(self) -> int | None:
+
+        depths: dict[str, int | None] = {}
+
+        for feature in self.features:
+            upstream = [depths[f.id] for f in feature.features]
+
+            if (feature.lookback is None) or (None in upstream):
+                depths[feature.id] = None
+
+            else:
+                depths[feature.id] = feature.lookback + max(upstream, default=0)
+
+        if None in depths.values():
+            return None
+
+        return max(depths.values(), default=0)
+
+    @classmethod
+    def compile(
+            cls,
+            targets: Iterable[Feature],
+            merged: dict[str, Feature] = None,
+            fuse: bool = False
+    ) -> "Plan":
+
+        merged = merged or {}
+
+        sources = {}
+        aliases = {}
+
+        for feature in targets:
+            source = merged.get(feature.id, feature)
+
+            sources[source.id] = source
+
+            if source.name != feature.name:
+                aliases[feature.id] = (source, feature)
+
+        targets = list(sources.values())
+
+        features = sort_features(targets)
+
+        return cls(
+            features=features, targets=targets, aliases=list(aliases.values()),
+            fusion=fuse_features(features) if fuse else {}
+        )
+
+    def prepare(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            materialize: str = INSERT,
+            release: bool = False,
+            spill: ColumnStorage = None
+    ) -> tuple[list[Feature], Lifetimes]:
+
+        if materialize not in MATERIALIZE:
+            raise ValueError(
+                f'materialize must be one of {MATERIALIZE}, '
+                f'not {materialize!r}.'
+            )
+
+        features = required_features(
+            self.features, self.targets, data=data,
+            cached=cached, override=override
+        )
+
+        lifetimes = Lifetimes.count(
+            features, self.targets_ids, release=release, spill=spill
+        )
+
+        self.result_memory = lifetimes.result_memory
+
+        return features, lifetimes
+
+    def execute(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            materialize: str = INSERT,
+            executor: Executor = None,
+            release: bool = False,
+            spill: ColumnStorage = None
+    ) -> dict[str, pd.Series]:
+
+        if executor is not None:
+            return self.execute_parallel(
+                data, executor=executor, cached=cached, override=override,
+                materialize=materialize, release=release, spill=spill
+            )
+
+        targets = self.targets_ids
+        results = {}
+
+        features, lifetimes = self.prepare(
+            data, cached=cached, override=override,
+            materialize=materialize, release=release, spill=spill
+        )
+
+        for feature in features:
+            feature_override = override and (feature.id in targets)
+
+            calculated = not feature.resolved(
+                data, cached=cached, override=feature_override
+            )
+            restored = (not calculated) and feature.restorable(data)
+
+            feature.evaluate(
+                data, cached=cached, override=feature_override,
+                materialize=(materialize == INSERT) and lifetimes.retained(feature)
+            )
+
+            if calculated:
+                lifetimes.computed(feature)
+
+            if (calculated or restored) and lifetimes.retained(feature):
+                if restored and (materialize == INSERT):
+                    data[feature.name] = feature.materialized
+
+                results[feature.name] = feature.materialized
+
+            lifetimes.done(feature)
+
+        return self.alias(data, results, materialize=materialize)
+
+    def execute_parallel(
+            self,
+            data: pd.DataFrame,
+            executor: Executor,
+            cached: bool = True,
+            override: bool = False,
+            materialize: str = INSERT,
+            release: bool = False,
+            spill: ColumnStorage = None
+    ) -> dict[str, pd.Series]:
+
+        targets = self.targets_ids
+
+        features, lifetimes = self.prepare(
+            data, cached=cached, override=override,
+            materialize=materialize, release=release, spill=spill
+        )
+
+        calculated = []
+        restored = []
+
+        for feature in features:
+            feature_override = override and (feature.id in targets)
+
+            if feature.resolved(data, cached=cached, override=feature_override):
+                if feature.restorable(data):
+                    restored.append(feature)
+
+                feature.evaluate(data, cached=cached, override=feature_override)
+
+                lifetimes.done(feature)
+
+            else:
+                feature.prepare(data)
+                calculated.append(feature)
+
+        profiler = PROFILER.get()
+
+        missing = []
+
+        for feature in calculated:
+            start = profiler.start() if profiler is not None else None
+
+            if feature.lookup():
+                if profiler is not None:
+                    profiler.record(feature, start, cache=HIT)
+
+                lifetimes.computed(feature)
+                lifetimes.done(feature)
+
+            else:
+                missing.append(feature)
+
+        def completed(feature: Feature) -> None:
+
+            feature.commit()
+
+            lifetimes.computed(feature)
+            lifetimes.done(feature)
+
+        schedule(missing, executor=executor, callback=completed)
+
+        return self.collect(
+            data, calculated + restored,
+            materialize=materialize, lifetimes=lifetimes
+        )
+
+    async def aexecute(
+            self,
+            data: pd.DataFrame,
+            cached: bool = True,
+            override: bool = False,
+            materialize: str = INSERT,
+            executor: Executor = None,
+            release: bool = False,
+            spill: ColumnStorage = None
+    ) -> dict[str, pd.Series]:
+
+        loop = asyncio.get_running_loop()
+
+        targets = self.targets_ids
+
+        features, lifetimes = self.prepare(
+            data, cached=cached, override=override,
+            materialize=materialize, release=release, spill=spill
+        )
+
+        processes = isinstance(executor, ProcessPoolExecutor)
+
+        profiler = PROFILER.get()
+
+        calculated = []
+        restored = []
+
+        for level in level_features(features):
+            missing = []
+
+            for feature in level:
+                feature_override = override and (feature.id in targets)
+
+                if feature.resolved(data, cached=cached, override=feature_override):
+                    if feature.restorable(data):
+                        restored.append(feature)
+
+                    feature.evaluate(data, cached=cached, override=feature_override)
+
+                    lifetimes.done(feature)
+
+                    continue
+
+                feature.prepare(data)
+                calculated.append(feature)
+
+                start = profiler.start() if profiler is not None else None
+
+                if feature.lookup():
+                    if profiler is not None:
+                        profiler.record(feature, start, cache=HIT)
+
+                    lifetimes.computed(feature)
+                    lifetimes.done(feature)
+
+                else:
+                    missing.append(feature)
+
+            running = []
+
+            for feature in missing:
+                function, args = offload(
+                    feature, processes=processes, measured=profiler is not None
+                )
+
+                running.append(loop.run_in_executor(executor, function, *args))
+
+            results = await asyncio.gather(*running)
+
+            for feature, result in zip(missing, results):
+                receive(feature, result, profiler)
+
+                feature.commit()
+
+                lifetimes.computed(feature)
+                lifetimes.done(feature)
+
+            await asyncio.sleep(0)
+
+        return self.collect(
+            data, calculated + restored,
+            materialize=materialize, lifetimes=lifetimes
+        )
+
+    def collect(
+            self,
+            data: pd.DataFrame,
+            features: list[Feature],
+            materialize: str,
+            lifetimes: Lifetimes
+    ) -> dict[str, pd.Series]:
+
+        results = {}
+
+        for feature in features:
+            if not lifetimes.retained(feature):
+                continue
+
+            if materialize == INSERT:
+                feature.write(data)
+
+            results[feature.name] = feature.materialized
+
+        return self.alias(data, results, materialize=materialize)
+
+    def alias(
+            self,
+            data: pd.DataFrame,
+            results: dict[str, pd.Series],
+            materialize: str
+    ) -> dict[str, pd.Series]:
+
+        for feature, alias in self.aliases:
+            alias.data = feature.data
+            alias.result = feature.result
+
+            if feature.name not in results:
+                continue
+
+            if materialize == INSERT:
+                data[alias.name] = alias.materialized
+
+            results[alias.name] = alias.materialized
+
+        return results
+
+    def checkpoint(self, data: pd.DataFrame) -> tuple[list[str], list[tuple[Any, ...]]]:
+
+        return (
+            list(data.columns),
+            [
+                (feature, copy.deepcopy(feature.kernel), feature.data, feature.result)
+                for feature in [*self.features, *(alias for _, alias in self.aliases)]
+            ]
+        )
+
+    def restore(
+            self,
+            data: pd.DataFrame,
+            checkpoint: tuple[list[str], list[tuple[Any, ...]]]
+    ) -> None:
+
+        columns, states = checkpoint
+
+        for feature, kernel, feature_data, result in states:
+            feature.kernel = kernel
+            feature.data = feature_data
+            feature.result = result
+
+        if isinstance(data, pd.DataFrame):
+            data.drop(
+                columns=[name for name in data.columns if name not in columns],
+                inplace=True
+            )
+
+    def update(
+            self,
+            data: pd.DataFrame,
+            materialize: str = INSERT,
+            atomic: bool = False
+    ) -> dict[str, pd.Series]:
+
+        if materialize not in MATERIALIZE:
+            raise ValueError(
+                f'materialize must be one of {MATERIALIZE}, '
+                f'not {materialize!r}.'
+            )
+
+        checkpoint = self.checkpoint(data) if atomic else None
+
+        try:
+            for feature in self.features:
+                feature.seed()
+
+            results = {}
+
+            for feature in self.features:
+                feature.advance(data, materialize=materialize == INSERT)
+
+                results[feature.name] = feature.materialized
+
+        except Exception:
+            if checkpoint is not None:
+                self.restore(data, checkpoint)
+
+            raise
+
+        return self.alias(data, results, materialize=materialize)
@@ -0,0 +1,183 @@
+# profiler.py
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Generator, Any
+
+import pandas as pd
+
+from feature_space.lifetime import nbytes
+
+__all__ = [
+    "FeatureProfile",
+    "Profiler",
+    "profiling",
+    "clock",
+    "traced",
+    "measure",
+    "PROFILER",
+    "HIT",
+    "MISS"
+]
+
+HIT, MISS = 'hit', 'miss'
+
+def clock() -> tuple[float, float]:
+
+    return time.perf_counter(), time.thread_time()
+
+def traced() -> int | None:
+
+    if not tracemalloc.is_tracing():
+        return None
+
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    return current
+
+def measure(
+        function: Callable[..., Any],
+        *args: Any
+) -> tuple[Any, float, float]:
+
+    wall, cpu = clock()
+
+    result = function(*args)
+
+    return result, time.perf_counter() - wall, time.thread_time() - cpu
+
+@dataclass
+class FeatureProfile:
+
+    id: str
+    name: str
+    type: str
+    wall: float
+    cpu: float
+    rows: int
+    result_bytes: int
+    cache: str | None = None
+    allocated: int | None = None
+
+@dataclass
+class Profiler:
+
+    hooks: list[Callable[[FeatureProfile], None]] = field(default_factory=list)
+    trace_memory: bool = False
+    profiles: list[FeatureProfile] = field(default_factory=list, repr=False)
+
+    def __len__(self) -> int:
+
+        return len(self.profiles)
+
+    def add(
+            self,
+            feature: Any,
+            wall: float,
+            cpu: float,
+            cache: str = None,
+            allocated: int = None
+    ) -> FeatureProfile:
+
+        result = feature.result
+
+        profile = FeatureProfile(
+            id=feature.id,
+            name=feature.name,
+            type=type(feature).__name__,
+            wall=wall,
+            cpu=cpu,
+            rows=0 if result is None else len(result),
+            result_bytes=nbytes(result),
+            cache=cache,
+            allocated=allocated
+        )
+
+        self.profiles.append(profile)
+
+        for hook in self.hooks:
+            hook(profile)
+
+        return profile
+
+    def start(self) -> tuple[float, float, int | None]:
+
+        return (*clock(), traced() if self.trace_memory else None)
+
+    def record(
+            self,
+            feature: Any,
+            start: tuple[float, float, int | None],
+            cache: str = None
+    ) -> FeatureProfile:
+
+        wall, cpu = clock()
+
+        allocated = None
+
+        if (start[2] is not None) and tracemalloc.is_tracing():
+            allocated = max(tracemalloc.get_traced_memory()[1] - start[2], 0)
+
+        return self.add(
+            feature, wall=wall - start[0], cpu=cpu - start[1],
+            cache=cache, allocated=allocated
+        )
+
+    def report(self) -> pd.DataFrame:
+
+        return pd.DataFrame(
+            [asdict(profile) for profile in self.profiles],
+            columns=list(FeatureProfile.__dataclass_fields__)
+        )
+
+    def summary(self) -> pd.DataFrame:
+
+        return self.report().groupby(['name', 'type'], sort=False).agg(
+            calls=('id', 'size'),
+            wall=('wall', 'sum'),
+            cpu=('cpu', 'sum'),
+            rows=('rows', 'sum'),
+            result_bytes=('result_bytes', 'sum'),
+            allocated=('allocated', 'max'),
+            hits=('cache', lambda s: int((s == HIT).sum())),
+            misses=('cache', lambda s: int((s == MISS).sum()))
+        ).sort_values('wall', ascending=False)
+
+    def to_json(self, **kwargs: Any) -> str:
+
+        return json.dumps([asdict(profile) for profile in self.profiles], **kwargs)
+
+    def clear(self) -> None:
+
+        self.profiles.clear()
+
+PROFILER: ContextVar[Profiler | None] = ContextVar('PROFILER', default=None)
+
+@contextmanager
+def profiling(profiler: Profiler | None) -> Generator[Profiler | None, None, None]:
+
+    if profiler is None:
+        yield PROFILER.get()
+
+        return
+
+    token = PROFILER.set(profiler)
+
+    tracing = profiler.trace_memory and not tracemalloc.is_tracing()
+
+    if tracing:
+        tracemalloc.start()
+
+    try:
+        yield profiler
+
+    finally:
+        if tracing:
+            tracemalloc.stop()
+
+        PROFILER.reset(token)
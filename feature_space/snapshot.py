@@ -0,0 +1,99 @@
+# snapshot.py
+
+import shutil
+from pathlib import Path
+from typing import Iterable, Any
+
+import numpy as np
+import pandas as pd
+
+from feature_space.storage import ColumnStorage
+from feature_space.spec import dump_spec, read_spec
+
+__all__ = [
+    "save_snapshot",
+    "load_snapshot",
+    "restore_results",
+    "is_snapshot"
+]
+
+SPEC, RESULTS = 'spec.json', 'results'
+
+def is_snapshot(path: str | Path) -> bool:
+
+    return (Path(path) / SPEC).is_file()
+
+def snapshot_index(features: list[Any], index: pd.Index = None) -> pd.Index:
+
+    if index is not None:
+        return index
+
+    for feature in features:
+        if isinstance(feature.result, pd.Series):
+            return feature.result.index
+
+        data = feature.data
+
+        if data is not None:
+            return data.index
+
+    length = next(len(f.result) for f in features if f.result is not None)
+
+    return pd.RangeIndex(length)
+
+def save_snapshot(
+        spec: dict[str, Any],
+        features: list[Any],
+        path: str | Path,
+        index: pd.Index = None
+) -> None:
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    if (path / RESULTS).exists():
+        shutil.rmtree(path / RESULTS)
+
+    calculated = [
+        feature for feature in features
+        if (feature.result is not None) and
+        not np.asarray(feature.result).dtype.hasobject
+    ]
+
+    if calculated:
+        storage = ColumnStorage(
+            path / RESULTS, index=snapshot_index(calculated, index)
+        )
+
+        for feature in calculated:
+            storage[feature.id] = feature.result
+
+    dump_spec(spec, path / SPEC)
+
+def load_snapshot(path: str | Path) -> tuple[dict[str, Any], ColumnStorage | None]:
+
+    path = Path(path)
+
+    spec = read_spec(path / SPEC)
+
+    if spec is None:
+        raise ValueError(f'{path} does not contain a snapshot spec.')
+
+    storage = ColumnStorage(path / RESULTS) if (path / RESULTS).is_dir() else None
+
+    return spec, storage
+
+def restore_results(
+        features: Iterable[Any],
+        storage: ColumnStorage | None,
+        results: bool | Iterable[str] = True
+) -> None:
+
+    if (storage is None) or (results is False):
+        return
+
+    names = None if results is True else set(results)
+
+    for feature in features:
+        if (feature.id in storage) and ((names is None) or (feature.name in names)):
+            feature.result = feature.restored = storage[feature.id]
@@ -0,0 +1,205 @@
+# spec.py
+
+import json
+import inspect
+from pathlib import Path
+from functools import cache
+from typing import Any
+
+import numpy as np
+
+__all__ = [
+    "register",
+    "type_name",
+    "feature_type",
+    "registered",
+    "parameters",
+    "arguments",
+    "features_spec",
+    "build_features",
+    "dump_spec",
+    "read_spec",
+    "FEATURES",
+    "SPEC_FORMAT",
+    "SPEC_VERSION"
+]
+
+SPEC_FORMAT = 'feature-space'
+SPEC_VERSION = 1
+
+FEATURES: dict[str, type] = {}
+
+def type_name(kind: type) -> str:
+
+    return f'{kind.__module__}.{kind.__qualname__}'
+
+def register(*types: type) -> type:
+
+    for kind in types:
+        FEATURES[type_name(kind)] = kind
+
+    return types[0]
+
+def registered(feature: Any) -> bool:
+
+    return FEATURES.get(type_name(type(feature))) is type(feature)
+
+def feature_type(name: str) -> type:
+
+    if name in FEATURES:
+        return FEATURES[name]
+
+    matches = [kind for kind in FEATURES.values() if kind.__name__ == name]
+
+    if len(matches) == 1:
+        return matches[0]
+
+    if matches:
+        raise ValueError(
+            f'Feature type {name} is ambiguous between '
+            f'{", ".join(type_name(kind) for kind in matches)}.'
+        )
+
+    raise ValueError(
+        f'Feature type {name} is not registered. '
+        f'Registered types are: {", ".join(FEATURES)}.'
+    )
+
+@cache
+def parameters(kind: type) -> tuple[str, ...]:
+
+    return tuple(
+        parameter.name
+        for parameter in list(inspect.signature(kind.__init__).parameters.values())[1:]
+        if (parameter.name != 'name') and (
+            parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        )
+    )
+
+def arguments(feature: Any) -> dict[str, Any]:
+
+    values = {}
+
+    for name in parameters(type(feature)):
+        if name in feature.kwargs:
+            values[name] = feature.kwargs[name]
+
+        elif name in vars(feature):
+            values[name] = vars(feature)[name]
+
+    return values
+
+def feature_entry(feature: Any, nodes: dict[int, str]) -> dict[str, Any]:
+
+    if not registered(feature):
+        raise ValueError(
+            f'Feature {feature.name} of type {type(feature).__name__} '
+            f'is not registered, and cannot be written to a spec.'
+        )
+
+    values = arguments(feature)
+
+    for name in parameters(type(feature)):
+        if name not in values:
+            raise ValueError(
+                f'Parameter {name} of feature {feature.name} of type '
+                f'{type(feature).__name__} is not stored in its kwargs or '
+                f'attributes, and cannot be written to a spec.'
+            )
+
+    params = {}
+    inputs = {}
+
+    for name, value in values.items():
+        if id(value) in nodes:
+            inputs[name] = nodes[id(value)]
+
+        else:
+            params[name] = value
+
+    return dict(
+        id=feature.id,
+        type=type_name(type(feature)),
+        name=feature.name,
+        params=params,
+        inputs=inputs,
+        features=[f.id for f in feature.features]
+    )
+
+def features_spec(features: list[Any]) -> list[dict[str, Any]]:
+
+    nodes = {id(feature): feature.id for feature in features}
+
+    return [feature_entry(feature, nodes) for feature in features]
+
+def rewire(feature: Any, child: Any, node: Any) -> None:
+
+    feature.features = [node if f is child else f for f in feature.features]
+
+    for name, value in list(vars(feature).items()):
+        if value is child:
+            setattr(feature, name, node)
+
+def build_features(entries: list[dict[str, Any]]) -> dict[str, Any]:
+
+    built = {}
+
+    for entry in entries:
+        feature = feature_type(entry['type'])(
+            **entry['params'],
+            **{name: built[key] for name, key in entry['inputs'].items()},
+            name=entry['name']
+        )
+
+        feature.id = entry['id']
+
+        for child, key in zip(list(feature.features), entry['features']):
+            node = built.get(key)
+
+            if (node is not None) and (child is not node):
+                rewire(feature, child, node)
+
+        built[feature.id] = feature
+
+    return built
+
+def encode(value: Any) -> Any:
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, (tuple, set)):
+        return list(value)
+
+    raise TypeError(
+        f'Object of type {type(value).__name__} cannot be written to a spec.'
+    )
+
+def dump_spec(spec: dict[str, Any], path: str | Path) -> None:
+
+    with open(path, 'w') as file:
+        json.dump(
+            dict(format=SPEC_FORMAT, version=SPEC_VERSION, **spec),
+            file, default=encode
+        )
+
+def read_spec(path: str | Path) -> dict[str, Any] | None:
+
+    with open(path, 'rb') as file:
+        if file.read(1) != b'{':
+            return None
+
+        file.seek(0)
+
+        spec = json.load(file)
+
+    if spec.get('format') != SPEC_FORMAT:
+        return None
+
+    if spec.get('version', SPEC_VERSION) > SPEC_VERSION:
+        raise ValueError(
+            f'Spec version {spec["version"]} is newer than '
+            f'the supported version {SPEC_VERSION}.'
+        )
+
+    return spec
@@ -0,0 +1,136 @@
+# storage.py
+
+import os
+import json
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "ColumnStorage"
+]
+
+@dataclass
+class ColumnStorage:
+
+    path: str | Path
+    index: pd.Index | None = field(default=None, repr=False)
+    files: dict[str, str] = field(default_factory=dict, repr=False)
+
+    MANIFEST = 'columns.json'
+    INDEX = 'index.pkl'
+
+    def __post_init__(self) -> None:
+
+        self.path = Path(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        if (self.path / self.MANIFEST).exists():
+            with open(self.path / self.MANIFEST, 'r') as file:
+                self.files.update(json.load(file))
+
+        if self.index is None and (self.path / self.INDEX).exists():
+            self.index = pd.read_pickle(self.path / self.INDEX)
+
+        elif self.index is not None:
+            self.write_index(self.index)
+
+    def __len__(self) -> int:
+
+        return 0 if self.index is None else len(self.index)
+
+    def __contains__(self, name: str) -> bool:
+
+        return name in self.files
+
+    def __getitem__(self, name: str | list[str]) -> pd.Series | pd.DataFrame:
+
+        if isinstance(name, list):
+            return pd.DataFrame(
+                {column: self[column] for column in name}, index=self.index
+            )
+
+        values = np.load(self.path / self.files[name], mmap_mode='r')
+
+        return pd.Series(values, index=self.index, name=name, copy=False)
+
+    def __setitem__(self, name: str, values: pd.Series | np.ndarray) -> None:
+
+        values = np.asarray(values)
+
+        if len(values) != len(self):
+            raise ValueError(
+                f'Column {name} of length {len(values)} does not match '
+                f'storage of length {len(self)}.'
+            )
+
+        created = name not in self.files
+
+        location = self.path / self.files.get(name, f'{len(self.files)}.npy')
+        temporary = location.with_suffix('.tmp')
+
+        array = np.lib.format.open_memmap(
+            temporary, mode='w+', dtype=values.dtype, shape=values.shape
+        )
+        array[:] = values
+        array.flush()
+
+        del array
+
+        os.replace(temporary, location)
+
+        if created:
+            self.files[name] = location.name
+
+            self.write_manifest()
+
+    @property
+    def columns(self) -> list[str]:
+
+        return list(self.files)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, path: str | Path) -> "ColumnStorage":
+
+        storage = cls(path=path, index=data.index)
+
+        for name in data.columns:
+            storage[name] = data[name]
+
+        return storage
+
+    def write_index(self, index: pd.Index) -> None:
+
+        self.index = index
+
+        pd.to_pickle(index, self.path / self.INDEX)
+
+    def write_manifest(self) -> None:
+
+        with open(self.path / self.MANIFEST, 'w') as file:
+            json.dump(self.files, file)
+
+    def rows(
+            self,
+            start: int,
+            stop: int,
+            columns: Iterable[str] = None
+    ) -> pd.DataFrame:
+
+        columns = list(self.columns if columns is None else columns)
+
+        return pd.DataFrame(
+            {
+                name: np.array(self[name].to_numpy()[start:stop])
+                for name in columns
+            },
+            index=self.index[start:stop],
+            columns=columns
+        )
+
+    def to_frame(self, columns: Iterable[str] = None) -> pd.DataFrame:
+
+        return self[list(self.columns if columns is None else columns)]
@@ -0,0 +1,103 @@
+# store.py
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Generator, Any
+
+import pandas as pd
+
+__all__ = [
+    "ResultStore",
+    "State",
+    "storing",
+    "STORE"
+]
+
+@dataclass
+class ResultStore:
+
+    states: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    def __contains__(self, feature: Any) -> bool:
+
+        return self.result(feature) is not None
+
+    def __len__(self) -> int:
+
+        return len(self.results)
+
+    @property
+    def results(self) -> dict[str, pd.Series]:
+
+        return {
+            key: state['result'] for key, state in self.states.items()
+            if state.get('result') is not None
+        }
+
+    def get(self, feature: Any, key: str) -> Any:
+
+        return self.states.get(feature.id, {}).get(key)
+
+    def set(self, feature: Any, key: str, value: Any) -> None:
+
+        self.states.setdefault(feature.id, {})[key] = value
+
+    def result(self, feature: Any) -> pd.Series | None:
+
+        return self.get(feature, 'result')
+
+    def release(self, feature: Any) -> None:
+
+        self.states.pop(feature.id, None)
+
+    def clear(self) -> None:
+
+        self.states.clear()
+
+STORE: ContextVar[ResultStore | None] = ContextVar('STORE', default=None)
+
+@contextmanager
+def storing(store: ResultStore | None) -> Generator[ResultStore | None, None, None]:
+
+    if store is None:
+        yield STORE.get()
+
+        return
+
+    token = STORE.set(store)
+
+    try:
+        yield store
+
+    finally:
+        STORE.reset(token)
+
+class State:
+
+    def __set_name__(self, owner: type, name: str) -> None:
+
+        self.name = name
+        self.attribute = f'_{name}'
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+
+        if instance is None:
+            return self
+
+        store = STORE.get()
+
+        if store is not None:
+            return store.get(instance, self.name)
+
+        return instance.__dict__.get(self.attribute)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+
+        store = STORE.get()
+
+        if store is not None:
+            store.set(instance, self.name, value)
+
+        else:
+            instance.__dict__[self.attribute] = value
@@ -0,0 +1,461 @@
+# stream.py
+
+import math
+from collections import deque
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "tail",
+    "Kernel",
+    "Difference",
+    "RollingSum",
+    "RollingMean",
+    "RollingStd",
+    "ExponentialMean",
+    "RelativeStrength",
+    "AverageTrueRange",
+    "Window"
+]
+
+def tail(values: np.ndarray, size: int) -> np.ndarray:
+
+    return values[max(len(values) - size, 0):]
+
+class Kernel:
+
+    def __init__(self) -> None:
+
+        self.seeded = False
+
+    def reset(self) -> None:
+
+        self.seeded = False
+
+    def seed(self, *history: np.ndarray) -> None:
+
+        self.reset()
+        self.update(*(tail(values, self.lookback) for values in history))
+
+        self.seeded = True
+
+    @property
+    def lookback(self) -> int:
+
+        return 0
+
+    def update(self, *values: np.ndarray) -> np.ndarray:
+
+        raise NotImplementedError
+
+class Difference(Kernel):
+
+    def __init__(self, periods: int = 1, relative: bool = False) -> None:
+
+        self.periods = periods
+        self.relative = relative
+
+        self.window = deque(maxlen=self.periods)
+
+        super().__init__()
+
+    @property
+    def lookback(self) -> int:
+
+        return self.periods
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.window.clear()
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        values = np.asarray(values, dtype=float)
+        previous = np.empty(len(values))
+
+        for i, value in enumerate(values):
+            previous[i] = (
+                self.window[0] if len(self.window) == self.periods else np.nan
+            )
+
+            self.window.append(value)
+
+        if not self.relative:
+            return values - previous
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return ((values - previous) / previous) * 100
+
+class RollingSum(Kernel):
+
+    def __init__(self, span: int, min_periods: int = None) -> None:
+
+        self.span = span
+        self.min_periods = span if min_periods is None else min_periods
+
+        self.window = deque(maxlen=self.span)
+        self.total = 0.0
+        self.count = 0
+
+        super().__init__()
+
+    @property
+    def lookback(self) -> int:
+
+        return self.span
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.window.clear()
+        self.total = 0.0
+        self.count = 0
+
+    def push(self, value: float) -> None:
+
+        if len(self.window) == self.span:
+            removed = self.window[0]
+
+            if not math.isnan(removed):
+                self.total -= removed
+                self.count -= 1
+
+        self.window.append(value)
+
+        if not math.isnan(value):
+            self.total += value
+            self.count += 1
+
+    def statistic(self) -> float:
+
+        return self.total
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        output = np.empty(len(values))
+
+        for i, value in enumerate(values):
+            self.push(float(value))
+
+            output[i] = (
+                self.statistic()
+                if self.count and (self.count >= self.min_periods) else
+                np.nan
+            )
+
+        return output
+
+class RollingMean(RollingSum):
+
+    def statistic(self) -> float:
+
+        return self.total / self.count
+
+class RollingStd(Kernel):
+
+    def __init__(self, span: int, min_periods: int = None, ddof: int = 1) -> None:
+
+        self.span = span
+        self.min_periods = span if min_periods is None else min_periods
+        self.ddof = ddof
+
+        self.window = deque(maxlen=self.span)
+        self.mean = 0.0
+        self.squares = 0.0
+        self.count = 0
+
+        super().__init__()
+
+    @property
+    def lookback(self) -> int:
+
+        return self.span
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.window.clear()
+        self.mean = 0.0
+        self.squares = 0.0
+        self.count = 0
+
+    def push(self, value: float) -> None:
+
+        if len(self.window) == self.span:
+            removed = self.window[0]
+
+            if not math.isnan(removed):
+                self.count -= 1
+
+                if self.count:
+                    delta = removed - self.mean
+                    self.mean -= delta / self.count
+                    self.squares -= delta * (removed - self.mean)
+
+                else:
+                    self.mean = self.squares = 0.0
+
+        self.window.append(value)
+
+        if not math.isnan(value):
+            self.count += 1
+
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.squares += delta * (value - self.mean)
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        output = np.empty(len(values))
+
+        for i, value in enumerate(values):
+            self.push(float(value))
+
+            output[i] = (
+                math.sqrt(max(self.squares, 0.0) / (self.count - self.ddof))
+                if (
+                    (self.count >= self.min_periods) and
+                    (self.count > self.ddof)
+                ) else
+                np.nan
+            )
+
+        return output
+
+class ExponentialMean(Kernel):
+
+    def __init__(self, alpha: float, min_periods: int = 0) -> None:
+
+        self.alpha = alpha
+        self.min_periods = min_periods
+
+        self.weighted = np.nan
+        self.weight = 1.0
+        self.count = 0
+
+        super().__init__()
+
+    @classmethod
+    def from_span(cls, span: int, min_periods: int = 0) -> "ExponentialMean":
+
+        return cls(alpha=2 / (span + 1), min_periods=min_periods)
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.weighted = np.nan
+        self.weight = 1.0
+        self.count = 0
+
+    def seed(self, values: np.ndarray) -> None:
+
+        self.reset()
+
+        observed = ~np.isnan(values)
+
+        if observed.any():
+            self.weighted = pd.Series(values).ewm(
+                alpha=self.alpha, adjust=False
+            ).mean().iloc[-1]
+
+            trailing = len(values) - 1 - np.flatnonzero(observed)[-1]
+            self.weight = (1 - self.alpha) ** trailing
+            self.count = int(observed.sum())
+
+        self.seeded = True
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        output = np.empty(len(values))
+
+        for i, value in enumerate(values):
+            value = float(value)
+            observed = not math.isnan(value)
+
+            self.count += observed
+
+            if not math.isnan(self.weighted):
+                self.weight *= 1 - self.alpha
+
+                if observed:
+                    if self.weighted != value:
+                        self.weighted = (
+                            (self.weight * self.weighted) + (self.alpha * value)
+                        ) / (self.weight + self.alpha)
+
+                    self.weight = 1.0
+
+            elif observed:
+                self.weighted = value
+
+            output[i] = self.weighted if self.count >= self.min_periods else np.nan
+
+        return output
+
+class RelativeStrength(Kernel):
+
+    def __init__(self, span: int, wilder: bool = False) -> None:
+
+        self.span = span
+        self.wilder = wilder
+
+        if self.wilder:
+            self.gains = ExponentialMean(alpha=1 / span, min_periods=span)
+            self.losses = ExponentialMean(alpha=1 / span, min_periods=span)
+
+        else:
+            self.gains = RollingMean(span)
+            self.losses = RollingMean(span)
+
+        super().__init__()
+
+    @property
+    def lookback(self) -> int:
+
+        return self.span
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.gains.reset()
+        self.losses.reset()
+
+    def seed(self, values: np.ndarray) -> None:
+
+        self.reset()
+
+        self.gains.seed(np.where(values > 0, values, 0.0))
+        self.losses.seed(np.where(values < 0, -values, 0.0))
+
+        self.seeded = True
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+
+        values = np.asarray(values, dtype=float)
+
+        gain = self.gains.update(np.where(values > 0, values, 0.0))
+        loss = self.losses.update(np.where(values < 0, -values, 0.0))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 100 - (100 / (1 + (gain / loss)))
+
+class AverageTrueRange(Kernel):
+
+    def __init__(self, span: int = 14, wilder: bool = True) -> None:
+
+        self.span = span
+        self.wilder = wilder
+
+        self.close = np.nan
+        self.mean = ExponentialMean(
+            alpha=1 / span if wilder else 2 / (span + 1), min_periods=span
+        )
+
+        super().__init__()
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.close = np.nan
+        self.mean.reset()
+
+    def true_range(
+            self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> np.ndarray:
+
+        previous = np.concatenate([[self.close], close[:-1]])
+
+        if len(close):
+            self.close = float(close[-1])
+
+        return np.fmax(
+            high - low, np.fmax(np.abs(high - previous), np.abs(low - previous))
+        )
+
+    def seed(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+
+        self.reset()
+
+        self.mean.seed(
+            self.true_range(
+                np.asarray(high, dtype=float),
+                np.asarray(low, dtype=float),
+                np.asarray(close, dtype=float)
+            )
+        )
+
+        self.seeded = True
+
+    def update(
+            self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> np.ndarray:
+
+        return self.mean.update(
+            self.true_range(
+                np.asarray(high, dtype=float),
+                np.asarray(low, dtype=float),
+                np.asarray(close, dtype=float)
+            )
+        )
+
+class Window(Kernel):
+
+    def __init__(
+            self,
+            lookback: int,
+            function: Callable[..., np.ndarray]
+    ) -> None:
+
+        self.function = function
+
+        self._lookback = lookback
+        self.history: tuple[np.ndarray, ...] = ()
+
+        super().__init__()
+
+    @property
+    def lookback(self) -> int:
+
+        return self._lookback
+
+    def reset(self) -> None:
+
+        super().reset()
+
+        self.history = ()
+
+    def seed(self, *history: np.ndarray) -> None:
+
+        self.reset()
+
+        self.history = tuple(
+            np.asarray(tail(values, self.lookback), dtype=float)
+            for values in history
+        )
+
+        self.seeded = True
+
+    def update(self, *values: np.ndarray) -> np.ndarray:
+
+        if not self.history:
+            self.history = tuple(np.empty(0) for _ in values)
+
+        inputs = tuple(
+            np.concatenate([history, np.asarray(current, dtype=float)])
+            for history, current in zip(self.history, values)
+        )
+
+        self.history = tuple(tail(array, self.lookback) for array in inputs)
+
+        output = np.asarray(self.function(*inputs))
+
+        return output[len(output) - len(values[0]):]
@@ -0,0 +1,812 @@
+# test_feature_space.py
+
+import asyncio
+import tracemalloc
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_space import (
+    Column, Change, MiddleBollingerBand, STD, BottomBollingerBand,
+    TopBollingerBand, Volatility, TRAMA, Momentum, MomentumOscillator,
+    RSI, EMA, SMA, MACD, MACDSignal, MACDHistogram, Flips, LiquiditySpikes,
+    ATR, SuperTrend, Feature, Dataset, UpdateQueue, Profiler, BACKENDS,
+    DTypePolicy, ColumnStorage, ResultCache, register, feature_type
+)
+from feature_space import spec
+
+BASELINE = Path(__file__).parent / 'data' / 'baseline.csv'
+
+INPUTS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def build() -> Dataset:
+
+    close = Column('Close')
+    volume = Column('Volume')
+
+    change = Change(close)
+    middle = MiddleBollingerBand(close, 20)
+    std = STD(close, 20)
+    volatility = Volatility(change)
+    ema = EMA(close, 34)
+    sma = SMA(close, 20)
+    macd = MACD(ema, sma)
+    signal = MACDSignal(macd, 15)
+
+    features = [
+        change, middle, std,
+        BottomBollingerBand(middle, std), TopBollingerBand(middle, std),
+        volatility, TRAMA(volatility, 10), Momentum(change, 35),
+        MomentumOscillator(close, 10), RSI(change, 14), ema, sma, macd,
+        signal, MACDHistogram(signal), Flips(ema, sma),
+        LiquiditySpikes(volume, 20, 2),
+        LiquiditySpikes(volume, 20, 2, gradual=True)
+    ]
+
+    return Dataset(
+        name='Baseline', features=features[:9],
+        datasets=[Dataset(name='Inner', features=features[9:])]
+    )
+
+@pytest.fixture
+def expected() -> pd.DataFrame:
+
+    return pd.read_csv(BASELINE)
+
+@pytest.fixture
+def data(expected: pd.DataFrame) -> pd.DataFrame:
+
+    return expected[INPUTS].copy()
+
+def assert_matches(data: pd.DataFrame, expected: pd.DataFrame) -> None:
+
+    for name in expected.columns:
+        np.testing.assert_allclose(
+            np.asarray(data[name], dtype=float),
+            expected[name].to_numpy(dtype=float),
+            rtol=1e-9, atol=1e-9, err_msg=name
+        )
+
+def test_calculate_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    build().calculate(data)
+
+    assert_matches(data, expected)
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_transform_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame,
+        backend: str
+) -> None:
+
+    dataset = build()
+    dataset.backend = backend
+
+    assert_matches(dataset.transform(data), expected)
+
+def test_batch_calculate_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    output = data.copy()
+    build().calculate(output, materialize='batch')
+
+    assert_matches(output, expected)
+
+@pytest.mark.filterwarnings('error')
+def test_transform_consolidates_results(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    close = Column('Close')
+
+    dataset = build()
+    dataset.features.extend(SMA(close, size) for size in range(2, 402))
+
+    output = dataset.transform(data)
+
+    assert_matches(output, expected)
+
+    np.testing.assert_allclose(output['Close_SMA_401'], data['Close'].rolling(401).mean())
+
+    assert output._mgr.nblocks <= data._mgr.nblocks + 2
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_grouped_backends_match_pandas(data: pd.DataFrame, backend: str) -> None:
+
+    groups = np.repeat(['a', 'b'], len(data) // 2)
+
+    expected = build().transform(data, groups=groups)
+
+    dataset = build()
+    dataset.backend = backend
+
+    assert_matches(dataset.transform(data, groups=groups), expected)
+
+def reference_atr(data: pd.DataFrame, span: int, alpha: float) -> list[float]:
+
+    values = []
+    average = None
+    previous = None
+
+    for high, low, close in zip(data['High'], data['Low'], data['Close']):
+        ranges = [high - low]
+
+        if previous is not None:
+            ranges.extend([abs(high - previous), abs(low - previous)])
+
+        previous = close
+        average = max(ranges) if average is None else (1 - alpha) * average + alpha * max(ranges)
+
+        values.append(average if len(values) >= span - 1 else np.nan)
+
+    return values
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('method, alpha', [('wilder', lambda span: 1 / span), ('ema', lambda span: 2 / (span + 1))])
+def test_atr_matches_reference_per_row(
+        data: pd.DataFrame,
+        backend: str,
+        method: str,
+        alpha
+) -> None:
+
+    high, low, close = Column('High'), Column('Low'), Column('Close')
+
+    atrs = [ATR(high, low, close, span=span, method=method) for span in (7, 14)]
+
+    output = Dataset(features=atrs, backend=backend).transform(data)
+
+    assert len({atr.name for atr in atrs}) == len(atrs)
+
+    for atr in atrs:
+        np.testing.assert_allclose(
+            np.asarray(output[atr.name], dtype=float),
+            reference_atr(data, atr.span, alpha(atr.span)),
+            rtol=1e-9, err_msg=atr.name
+        )
+
+def mapped(values: pd.Series | np.ndarray) -> bool:
+
+    values = np.asarray(values)
+
+    while isinstance(values, np.ndarray):
+        if isinstance(values, np.memmap):
+            return True
+
+        values = values.base
+
+    return False
+
+def test_calculate_into_column_storage(
+        data: pd.DataFrame,
+        expected: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    storage = ColumnStorage.from_frame(data, tmp_path / 'history')
+
+    dataset = build()
+    dataset.calculate(storage)
+
+    assert_matches(storage.to_frame(), expected)
+
+    for feature in dataset.plan.features:
+        assert mapped(feature.result), feature.name
+
+def test_column_storage_round_trips_and_loads_some_columns(
+        data: pd.DataFrame,
+        expected: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    build().calculate(ColumnStorage.from_frame(data, tmp_path / 'history'))
+
+    storage = ColumnStorage(tmp_path / 'history')
+
+    assert storage.columns == list(expected.columns)
+    assert storage.index.equals(expected.index)
+
+    assert_matches(storage.to_frame(), expected)
+
+    names = ['Close', 'Close_RSI_14']
+
+    assert list(storage.to_frame(names).columns) == names
+
+    pd.testing.assert_frame_equal(
+        storage.rows(50, 120, columns=names), expected[names].iloc[50:120]
+    )
+
+def test_dtype_policy_downcasts_written_columns(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    dataset = build()
+    dataset.dtypes = DTypePolicy()
+
+    output = dataset.transform(data)
+
+    for name in expected.columns.difference(INPUTS):
+        assert output[name].dtype in (np.float32, np.int8), name
+
+        np.testing.assert_allclose(
+            output[name].to_numpy(dtype=float), expected[name].to_numpy(dtype=float),
+            rtol=1e-5, atol=1e-5, err_msg=name
+        )
+
+    for feature in dataset.plan.features:
+        assert np.asarray(feature.result).dtype.itemsize == 8, feature.name
+
+def test_dtype_policy_keeps_full_precision_results_with_storage(
+        data: pd.DataFrame,
+        expected: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    storage = ColumnStorage.from_frame(data, tmp_path / 'history')
+
+    dataset = build()
+    dataset.dtypes = DTypePolicy()
+    dataset.calculate(storage)
+
+    for name in expected.columns.difference(INPUTS):
+        assert storage[name].dtype in (np.float32, np.int8), name
+
+    assert_matches(
+        pd.DataFrame({f.name: np.asarray(f.result) for f in dataset.plan.features}),
+        expected.drop(columns=INPUTS)
+    )
+
+def test_parallel_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    with ThreadPoolExecutor(4) as executor:
+        output = build().transform(data, executor=executor)
+
+    assert_matches(output, expected)
+
+def test_update_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    dataset = build()
+
+    history = data.iloc[:150].copy()
+    dataset.calculate(history)
+
+    frames = [history]
+
+    for start, stop in ((150, 151), (151, 160), (160, 200)):
+        rows = data.iloc[start:stop].copy()
+        dataset.update(rows)
+
+        frames.append(rows)
+
+    assert_matches(pd.concat(frames), expected)
+
+def test_chunked_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    output = pd.concat(build().calculate_chunked(data, chunk_size=64))
+
+    assert_matches(output, expected)
+
+def test_plan_recompiles_after_features_change(data: pd.DataFrame) -> None:
+
+    close = Column('Close')
+
+    dataset = Dataset(features=[SMA(close, 5)])
+    dataset.calculate(data.copy())
+
+    dataset.features.append(EMA(close, 10))
+
+    output = data.copy()
+    dataset.calculate(output)
+
+    assert 'Close_EMA_10' in output
+    assert 'Close_EMA_10' in dataset.plan.features_names
+
+def test_plan_recompiles_after_nested_features_change(data: pd.DataFrame) -> None:
+
+    close = Column('Close')
+
+    dataset = Dataset(datasets=[Dataset(features=[SMA(close, 5)])])
+    dataset.calculate(data.copy())
+
+    dataset.datasets[0].features.append(SMA(close, 50))
+
+    output = dataset.transform(data.copy())
+
+    np.testing.assert_allclose(
+        output['Close_SMA_50'], data['Close'].rolling(50).mean()
+    )
+
+def test_nested_calculations_keep_their_plans(data: pd.DataFrame) -> None:
+
+    dataset = build()
+    inner = dataset.datasets[0]
+    shared = Dataset(name='Shared', datasets=[inner])
+
+    dataset.calculate(data.copy())
+    inner.calculate(data.copy())
+    shared.calculate(data.copy())
+
+    plans = [dataset.plan, inner.plan, shared.plan]
+
+    for _ in range(2):
+        dataset.calculate(data.copy())
+        inner.calculate(data.copy())
+        shared.calculate(data.copy())
+
+    assert all(a is b for a, b in zip([dataset.plan, inner.plan, shared.plan], plans))
+
+def test_members_changes_invalidate_plan(data: pd.DataFrame) -> None:
+
+    close = Column('Close')
+
+    inner = Dataset(features=[SMA(close, 20)])
+    dataset = Dataset(datasets=[inner])
+
+    dataset.calculate(data.copy())
+    inner.calculate(data.copy())
+
+    assert inner.plan is not None
+
+    dataset.datasets[0].features.append(SMA(close, 50))
+
+    assert inner.plan is None
+
+    output = data.copy()
+    dataset.calculate(output)
+
+    assert dataset.feature('Close_SMA_50').result is not None
+
+    np.testing.assert_allclose(
+        output['Close_SMA_50'], data['Close'].rolling(50).mean()
+    )
+
+def test_live_engine_requires_restart_after_features_change(
+        data: pd.DataFrame
+) -> None:
+
+    close = Column('Close')
+
+    dataset = Dataset(features=[SMA(close, 5)])
+
+    engine = dataset.live().start(data.iloc[:100].copy())
+    engine.push(data.iloc[100])
+
+    dataset.features.append(EMA(close, 10))
+
+    with pytest.raises(RuntimeError):
+        engine.push(data.iloc[101])
+
+    engine.start(data.iloc[:102].copy())
+
+    assert 'Close_EMA_10' in engine.columns
+
+def test_cached_results_stay_with_their_frame(data: pd.DataFrame) -> None:
+
+    dataset = Dataset(features=[SMA(Column('Close'), 5)])
+
+    dataset.calculate(data.copy())
+
+    other = data.copy()
+    other['Close'] *= 2
+
+    for output in (other, dataset.transform(other)):
+        assert 'Close_SMA_5' not in output
+
+    with ThreadPoolExecutor(2) as executor:
+        assert 'Close_SMA_5' not in dataset.transform(other, executor=executor)
+
+def test_snapshot_results_materialize_on_matching_index(
+        data: pd.DataFrame,
+        expected: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    dataset = build()
+    dataset.calculate(data.copy())
+    dataset.save(tmp_path / 'snapshot', results=True)
+
+    loaded = Dataset.load(tmp_path / 'snapshot')
+    output = loaded.transform(data)
+
+    assert {feature.name for feature in loaded.targets} <= set(output.columns)
+
+    assert_matches(output, expected[expected.columns.intersection(output.columns)])
+
+    loaded = Dataset.load(tmp_path / 'snapshot')
+
+    assert 'Close_SMA_20' not in loaded.transform(data.iloc[50:100])
+
+def test_copied_dataset_keeps_working(data: pd.DataFrame) -> None:
+
+    dataset = build()
+    dataset.calculate(data.copy())
+
+    copy = dataset.copy()
+    copy.datasets[0].features.append(SMA(Column('Close'), 50))
+
+    output = copy.transform(data.copy(), cached=False)
+
+    assert 'Close_SMA_50' in output
+
+def test_saving_keeps_the_stream_state(data: pd.DataFrame, tmp_path: Path) -> None:
+
+    ema = EMA(Column('Close'), 50)
+    dataset = Dataset(features=[ema, Scaled(ema, 2)])
+
+    history = data.iloc[:150].copy()
+    dataset.calculate(history)
+
+    dataset.save(tmp_path / 'dataset.pkl')
+    ema.save(tmp_path / 'ema.pkl')
+
+    assert ema.result is not None
+
+    rows = data.iloc[150:].copy()
+    dataset.update(rows)
+
+    np.testing.assert_allclose(
+        rows['Close_EMA_50'], data['Close'].ewm(span=50, adjust=False).mean().iloc[150:]
+    )
+
+    loaded = Dataset.load(tmp_path / 'dataset.pkl')
+
+    assert all(feature.result is None for feature in loaded.features)
+
+def test_update_requires_kernel_or_row_wise_feature(data: pd.DataFrame) -> None:
+
+    close = Column('Close')
+
+    rolling = Feature(
+        name='Close_Rolling_Max_3', features=[close],
+        calculator=lambda f: f.features[0].result.rolling(3).max()
+    )
+    scaled = Feature(
+        name='Close_Scaled', features=[close],
+        calculator=lambda f: f.features[0].result * 2, lookback=0
+    )
+
+    history = data.iloc[:150].copy()
+    rows = data.iloc[150:].copy()
+
+    dataset = Dataset(features=[scaled])
+    dataset.calculate(history)
+    dataset.update(rows)
+
+    np.testing.assert_allclose(rows['Close_Scaled'], rows['Close'] * 2)
+
+    dataset = Dataset(features=[rolling])
+    dataset.calculate(history)
+
+    with pytest.raises(ValueError):
+        dataset.update(data.iloc[150:].copy())
+
+def test_renamed_duplicates_are_calculated_once(data: pd.DataFrame) -> None:
+
+    close = Column('Close')
+
+    dataset = Dataset(features=[SMA(close, 5), SMA(close, 5, name='Fast')])
+
+    history = data.iloc[:150].copy()
+    dataset.calculate(history)
+
+    assert [feature.name for feature in dataset.plan.features] == ['Close', 'Close_SMA_5']
+
+    np.testing.assert_allclose(history['Fast'], history['Close'].rolling(5).mean())
+    np.testing.assert_allclose(dataset.feature('Fast').result, history['Fast'])
+
+    rows = data.iloc[150:].copy()
+    dataset.update(rows)
+
+    np.testing.assert_allclose(rows['Fast'], rows['Close_SMA_5'])
+
+    output = dataset.select('Fast').collect(data)
+
+    assert list(output.columns) == ['Fast']
+
+def test_fusion_is_opt_in_and_kept_on_the_plan(data: pd.DataFrame) -> None:
+
+    close = Column('Close')
+
+    dataset = Dataset(
+        features=[feature(close, span) for span in (5, 10, 20) for feature in (SMA, STD)]
+    )
+
+    expected = dataset.transform(data)
+
+    assert not dataset.plan.fusion
+
+    dataset.fuse = True
+
+    output = dataset.transform(data, cached=False)
+
+    families = set(dataset.plan.fusion.values())
+
+    assert len(families) == 1
+    assert not any(family.results for family in families)
+    assert not any('fusion' in vars(feature) for feature in dataset.plan.features)
+
+    assert_matches(output, expected)
+
+    selection = dataset.select(['Close_SMA_5', 'Close_SMA_10'])
+
+    assert set(selection.plan.fusion.values()).isdisjoint(families)
+
+def test_release_tracks_result_memory(data: pd.DataFrame) -> None:
+
+    dataset = build()
+    dataset.transform(data, release=True)
+
+    released = dataset.result_memory
+
+    dataset = build()
+    dataset.transform(data)
+
+    kept = dataset.result_memory
+
+    assert released.allocated == kept.allocated
+    assert 0 < released.peak < kept.peak == kept.allocated
+
+def test_profiler_records_result_bytes(data: pd.DataFrame) -> None:
+
+    profiler = Profiler()
+
+    dataset = build()
+    output = dataset.transform(data, profiler=profiler)
+
+    report = profiler.report().set_index('name')
+
+    assert report.loc['Close_SMA_20', 'result_bytes'] == output['Close_SMA_20'].to_numpy().nbytes
+    assert profiler.summary()['result_bytes'].sum() == report['result_bytes'].sum()
+    assert report['allocated'].isna().all()
+
+def test_profiler_traces_allocated_memory_on_request(data: pd.DataFrame) -> None:
+
+    profiler = Profiler(trace_memory=True)
+
+    build().transform(data, profiler=profiler)
+
+    report = profiler.report().set_index('name')
+
+    assert report['allocated'].notna().all()
+    assert report.loc['Close_RSI_14', 'allocated'] >= report.loc['Close_RSI_14', 'result_bytes']
+    assert not tracemalloc.is_tracing()
+
+def cached_key(feature: Feature, data: pd.DataFrame, cache: ResultCache) -> str:
+
+    Dataset(features=[feature]).calculate(data, cache=cache)
+
+    return feature.key
+
+def test_result_cache_keys_follow_inputs_and_params(
+        data: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    cache = ResultCache(tmp_path / 'cache')
+
+    key = cached_key(SMA(Column('Close'), 5, name='Fast'), data.copy(), cache)
+
+    assert cached_key(SMA(Column('Close'), 5, name='Fast'), data.copy(), cache) == key
+    assert cached_key(SMA(Column('Close'), 6, name='Fast'), data.copy(), cache) != key
+
+    changed = data.copy()
+    changed.loc[100, 'Close'] += 1
+
+    assert cached_key(SMA(Column('Close'), 5, name='Fast'), changed, cache) != key
+
+def test_result_cache_hits_after_the_first_run_and_from_disk(
+        data: pd.DataFrame,
+        expected: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    cache = ResultCache(tmp_path / 'cache')
+
+    for run, results in enumerate([cache, cache, ResultCache(tmp_path / 'cache')]):
+        profiler = Profiler()
+
+        output = build().transform(data, cache=results, profiler=profiler)
+
+        assert_matches(output, expected)
+
+        summary = profiler.summary()
+
+        assert summary['misses'].sum() == (summary['calls'].sum() if run == 0 else 0)
+        assert summary['hits'].sum() == (0 if run == 0 else summary['calls'].sum())
+
+    assert set(ResultCache(tmp_path / 'cache').entries) == set(cache.entries)
+
+def test_result_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+
+    values = pd.Series(np.arange(100, dtype=float))
+
+    cache = ResultCache(tmp_path / 'cache')
+    cache.save('first', values)
+
+    cache.size = 2 * cache.total
+
+    cache.save('second', values)
+    cache.load('first', index=values.index)
+    cache.save('third', values)
+
+    assert list(cache.entries) == ['first', 'third']
+    assert cache.total <= cache.size
+    assert sorted(p.stem for p in (tmp_path / 'cache').glob('*.npy')) == ['first', 'third']
+
+    assert cache.load('second', index=values.index) is None
+    np.testing.assert_array_equal(cache.load('third', index=values.index), values)
+
+def test_spec_round_trips_every_builtin_feature(
+        data: pd.DataFrame,
+        tmp_path: Path
+) -> None:
+
+    close = Column('Close')
+    atr = ATR(Column('High'), Column('Low'), close, span=10, method='ema')
+
+    dataset = build()
+    dataset.features.extend([atr, SuperTrend(close, atr, 14, 3), RSI(Change(close), 7, 'wilder')])
+
+    dataset.save(tmp_path / 'dataset.json')
+
+    loaded = Dataset.load(tmp_path / 'dataset.json')
+
+    assert_matches(loaded.transform(data), dataset.transform(data))
+
+class Scaled(Feature):
+
+    def __init__(self, feature: Feature, factor: float, name: str = None) -> None:
+
+        super().__init__(
+            name=name or f'{feature.name}_Scaled',
+            features=[feature],
+            calculator=lambda f: f.features[0].result * factor,
+            lookback=0
+        )
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> dict[str, type]:
+
+    features = dict(spec.FEATURES)
+
+    monkeypatch.setattr(spec, 'FEATURES', features)
+
+    return features
+
+def test_spec_requires_every_parameter(registry: dict[str, type]) -> None:
+
+    register(Scaled)
+
+    dataset = Dataset(features=[Scaled(Column('Close'), 2)])
+
+    with pytest.raises(ValueError):
+        dataset.to_spec()
+
+def test_spec_registry_is_keyed_by_qualified_name(registry: dict[str, type]) -> None:
+
+    other = type('SMA', (SMA,), {'__module__': 'custom'})
+
+    register(other)
+
+    entries = Dataset(features=[other(Column('Close'), 5), SMA(Column('Close'), 5)]).to_spec()
+
+    assert {entry['type'] for entry in entries['features']} == {
+        'feature_space.feature.Column', 'feature_space.features.SMA', 'custom.SMA'
+    }
+
+    assert feature_type('custom.SMA') is other
+    assert feature_type('EMA') is EMA
+
+    with pytest.raises(ValueError):
+        feature_type('SMA')
+
+class Weighted(Feature):
+
+    def __init__(self, feature: Feature, factor: float, name: str = None) -> None:
+
+        self.feature = feature
+        self.factor = factor
+
+        super().__init__(
+            name=name or f'{feature.name}_Weighted',
+            features=[self.feature],
+            calculator=lambda f: f.features[0].result * self.factor,
+            lookback=0
+        )
+
+def test_merging_keys_on_every_parameter(
+        data: pd.DataFrame,
+        registry: dict[str, type]
+) -> None:
+
+    register(Scaled, Weighted)
+
+    close = Column('Close')
+
+    dataset = Dataset(
+        features=[
+            Weighted(close, 2, name='Double'), Weighted(close, 3, name='Triple'),
+            Weighted(close, 2, name='Twice'), Scaled(close, 2, name='Half'),
+            Scaled(close, 3, name='Third')
+        ]
+    )
+
+    output = dataset.transform(data)
+
+    assert [f.name for f in dataset.plan.features] == ['Close', 'Double', 'Triple', 'Half', 'Third']
+
+    for name, factor in [('Double', 2), ('Triple', 3), ('Twice', 2), ('Half', 2), ('Third', 3)]:
+        np.testing.assert_allclose(output[name], data['Close'] * factor, err_msg=name)
+
+def test_update_queue_coalesces_and_matches_baseline(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    dataset = build()
+
+    history = data.iloc[:150].copy()
+    dataset.calculate(history)
+
+    bars = [data.iloc[i:i + 1].copy() for i in range(150, 200)]
+
+    async def stream() -> UpdateQueue:
+
+        async with dataset.updater(maxsize=8, materialize='batch') as updates:
+            for bar in bars:
+                await updates.put(bar)
+
+        return updates
+
+    updates = asyncio.run(stream())
+
+    assert not updates.running
+
+    assert_matches(pd.concat([history, *bars]), expected)
+
+def test_failed_update_restores_state(
+        data: pd.DataFrame,
+        expected: pd.DataFrame
+) -> None:
+
+    dataset = build()
+
+    history = data.iloc[:150].copy()
+    dataset.calculate(history)
+
+    broken = data.iloc[150:151].drop(columns=['Volume'])
+
+    async def stream() -> None:
+
+        async with dataset.updater() as updates:
+            await updates.put(broken)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(stream())
+
+    assert list(broken.columns) == ['Open', 'High', 'Low', 'Close']
+
+    rows = data.iloc[150:].copy()
+    dataset.update(rows)
+
+    assert_matches(pd.concat([history, rows]), expected)